@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from data.types import FeedHealth
+from interfaces.client import OverflowPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Hashable
+
+_T = TypeVar("_T")
+
+_FANOUT_BUFFER = 1_024  # default max_lag per live-stream subscriber
+
+
+def to_ms(dt: datetime) -> int:
+    """Convert *dt* to epoch milliseconds; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp() * 1_000)
+
+
+def feed_health(
+    symbol: str, last_message: tuple[int, int | None] | None, reconnects: int
+) -> FeedHealth:
+    """Build a :class:`FeedHealth` from a connector's freshest-event record."""
+    if last_message is None:
+        return FeedHealth(
+            symbol=symbol,
+            last_msg_ns=None,
+            lag_ms=math.inf,
+            skew_ms=None,
+            reconnects=reconnects,
+        )
+    last_ns, skew_ms = last_message
+    return FeedHealth(
+        symbol=symbol,
+        last_msg_ns=last_ns,
+        lag_ms=(time.monotonic_ns() - last_ns) / 1e6,
+        skew_ms=skew_ms,
+        reconnects=reconnects,
+    )
+
+
+class StreamFanout:
+    """Shares each normalized live stream between all of its consumers.
+
+    The first :meth:`subscribe` for a key starts one pump task that drains
+    the source and copies every item into a bounded queue per subscriber, so
+    a frame is normalized once however many strategies consume it.  What
+    happens when a subscriber's queue is full is that subscriber's
+    :class:`~interfaces.client.OverflowPolicy`; only ``BLOCK`` lets one slow
+    consumer hold back the others on its feed.  Holding the pump does not
+    hold the socket: the source's own buffer still drops its oldest events
+    once it fills.  The pump stops when the last subscriber of its key
+    leaves.
+    """
+
+    def __init__(self) -> None:
+        self._feeds: dict[Hashable, _Feed[Any]] = {}
+        self.lag_events = 0
+        """Times an item met a full subscriber queue since creation."""
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        source: Callable[[], AsyncGenerator[_T, None]],
+        *,
+        max_lag: int = _FANOUT_BUFFER,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncGenerator[_T, None]:
+        """Yield the items of the feed under *key*, starting it from *source*.
+
+        At most *max_lag* items are buffered for this subscriber.  Under
+        ``ERROR`` overflow the subscription raises :exc:`asyncio.QueueFull`.
+        """
+        sub: _Subscriber[_T] = _Subscriber(max_lag, on_overflow)
+        feed = self._join(key, source, sub)
+        try:
+            while not sub.overflowed:
+                item = await sub.queue.get()
+                if item is None:
+                    if feed.error is not None:
+                        raise feed.error
+                    return
+                yield item
+            raise asyncio.QueueFull(f"subscriber of {key!r} fell {max_lag} behind")
+        finally:
+            with contextlib.suppress(ValueError):
+                feed.subscribers.remove(sub)
+            # unblock a pump waiting to put into this queue under BLOCK
+            while not sub.queue.empty():
+                sub.queue.get_nowait()
+            if not feed.subscribers and self._feeds.get(key) is feed:
+                del self._feeds[key]
+                await _cancel(feed.task)
+
+    async def aclose(self) -> None:
+        """Stop every pump; open subscriptions end after their buffered items."""
+        feeds, self._feeds = self._feeds, {}
+        for feed in feeds.values():
+            await _cancel(feed.task)
+
+    def _join(
+        self,
+        key: Hashable,
+        source: Callable[[], AsyncGenerator[_T, None]],
+        sub: _Subscriber[_T],
+    ) -> _Feed[_T]:
+        feed: _Feed[_T] | None = self._feeds.get(key)
+        if feed is not None and feed.task is not None and not feed.task.done():
+            feed.subscribers.append(sub)
+            return feed
+        # no feed yet, or a finished one that late subscribers would wait on;
+        # the subscriber joins before the pump starts in case tasks run eagerly
+        feed = _Feed()
+        feed.subscribers.append(sub)
+        feed.task = asyncio.create_task(self._pump(feed, source()))
+        self._feeds[key] = feed
+        return feed
+
+    async def _pump(self, feed: _Feed[_T], source: AsyncGenerator[_T, None]) -> None:
+        try:
+            async with contextlib.aclosing(source):
+                async for item in source:
+                    # a copy: BLOCK awaits, and subscribers may leave meanwhile
+                    for sub in tuple(feed.subscribers):
+                        queue = sub.queue
+                        if not queue.full():
+                            queue.put_nowait(item)
+                            continue
+                        self.lag_events += 1
+                        if sub.policy is OverflowPolicy.BLOCK:
+                            await queue.put(item)
+                        elif sub.policy is OverflowPolicy.ERROR:
+                            sub.overflowed = True
+                            feed.subscribers.remove(sub)
+                        else:
+                            queue.get_nowait()
+                            queue.put_nowait(item)
+        except Exception as exc:
+            feed.error = exc
+        finally:
+            # None is the end-of-stream sentinel.  BLOCK subscribers get it
+            # after their backlog unless the pump is being cancelled; everyone
+            # else has the oldest item dropped to make room if needed.
+            cancelling = _cancelling()
+            for sub in tuple(feed.subscribers):
+                queue = sub.queue
+                if queue.full():
+                    if sub.policy is OverflowPolicy.BLOCK and not cancelling:
+                        await queue.put(None)
+                        continue
+                    queue.get_nowait()
+                queue.put_nowait(None)
+
+
+class _Subscriber(Generic[_T]):
+    __slots__ = ("overflowed", "policy", "queue")
+
+    def __init__(self, max_lag: int, policy: OverflowPolicy) -> None:
+        self.queue: asyncio.Queue[_T | None] = asyncio.Queue(max_lag)
+        self.policy = OverflowPolicy(policy)
+        self.overflowed = False
+
+
+class _Feed(Generic[_T]):
+    __slots__ = ("error", "subscribers", "task")
+
+    def __init__(self) -> None:
+        self.subscribers: list[_Subscriber[_T]] = []
+        self.error: Exception | None = None
+        self.task: asyncio.Task[None] | None = None
+
+
+def _cancelling() -> bool:
+    task = asyncio.current_task()
+    return task is not None and task.cancelling() > 0
+
+
+async def _cancel(task: asyncio.Task[None] | None) -> None:
+    if task is None or task.done():
+        return
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
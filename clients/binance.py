@@ -1,21 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, AsyncIterator
+    from datetime import datetime
     from decimal import Decimal
 
-from datetime import UTC, datetime
+from functools import partial
 
+from clients._common import StreamFanout, feed_health, to_ms
 from data.connectors.binance import BinanceConnector
 from data.connectors.types import KlineInterval
 from data.normalizers.bars import build_dollar_bars, build_tick_bars, build_volume_bars
-from data.normalizers.binance import to_time_bar, to_trade
-from interfaces.client import BaseCryptoClient
+from data.normalizers.binance import (
+    to_kline_arrays,
+    to_time_bar,
+    to_time_bar_from_row,
+    to_trade,
+)
+from interfaces.client import BaseCryptoClient, OverflowPolicy
 
 if TYPE_CHECKING:
-    from data.types import DollarBar, TickBar, TimeBar, Trade, VolumeBar
+    from data.normalizers.binance import KlineArrays
+    from data.types import DollarBar, FeedHealth, TickBar, TimeBar, Trade, VolumeBar
 
 
 class BinanceClient(BaseCryptoClient):
@@ -43,11 +51,13 @@ class BinanceClient(BaseCryptoClient):
     intervals: ClassVar[list[KlineInterval]] = [KlineInterval.M1]
 
     def __init__(self, api_key: str | None = None) -> None:
+        super().__init__()
         self._connector = BinanceConnector(api_key)
+        self._fanout = StreamFanout()
 
     # oke historical
 
-    async def time_bars(
+    async def _fetch_time_bars(
         self,
         symbol: str,
         interval: KlineInterval,
@@ -56,16 +66,40 @@ class BinanceClient(BaseCryptoClient):
         end: datetime,
     ) -> list[TimeBar]:
         """Fetch all closed time bars for *symbol* in [*start*, *end*]."""
+        normalize = partial(to_time_bar_from_row, symbol=symbol, interval=interval)
         bars: list[TimeBar] = []
-        async for raw in self._connector.fetch_klines(
+        async for page in self._connector.fetch_kline_pages(
             symbol,
             interval,
-            start_ms=_to_ms(start),
-            end_ms=_to_ms(end),
+            start_ms=to_ms(start),
+            end_ms=to_ms(end),
         ):
-            bars.append(to_time_bar(raw, symbol=symbol, interval=interval))
+            bars.extend(map(normalize, page))
         return bars
 
+    async def time_bar_arrays(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start: datetime,
+        end: datetime,
+    ) -> KlineArrays:
+        """Fetch closed bars for *symbol* in [*start*, *end*] as column arrays.
+
+        Float64 fast path for research and backtests — see
+        :class:`~data.normalizers.binance.KlineArrays`.
+        """
+        rows: list[list[Any]] = []
+        async for page in self._connector.fetch_kline_pages(
+            symbol,
+            interval,
+            start_ms=to_ms(start),
+            end_ms=to_ms(end),
+        ):
+            rows.extend(page)
+        return to_kline_arrays(rows)
+
     async def volume_bars(
         self,
         symbol: str,
@@ -101,38 +135,75 @@ class BinanceClient(BaseCryptoClient):
 
     # ---------------------------------------------------------------------- live
 
-    async def live_time_bars(
+    def live_time_bars(
         self,
         symbol: str,
         interval: KlineInterval,
+        *,
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[TimeBar]:
+        """Stream live closed time bars over WebSocket.
+
+        Concurrent consumers of the same symbol and interval share one feed.
+        """
+        return self._fanout.subscribe(
+            ("klines", symbol, interval),
+            partial(self._time_bar_stream, symbol, interval),
+            max_lag=max_lag,
+            on_overflow=on_overflow,
+        )
+
+    def live_trades(
+        self,
+        symbol: str,
+        *,
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[Trade]:
+        """Stream live trades over WebSocket.
+
+        Concurrent consumers of the same symbol share one feed.
+        """
+        return self._fanout.subscribe(
+            ("trades", symbol),
+            partial(self._trade_stream, symbol),
+            max_lag=max_lag,
+            on_overflow=on_overflow,
+        )
+
+    @property
+    def lag_events(self) -> int:
+        return self._fanout.lag_events + self._connector.dropped_events
+
+    async def feed_health(self, symbol: str) -> FeedHealth:
+        return feed_health(
+            symbol,
+            self._connector.last_message(symbol),
+            self._connector.reconnects,
+        )
+
+    # ----------------------------------------------------------------- helpers
+
+    async def _time_bar_stream(
+        self, symbol: str, interval: KlineInterval
     ) -> AsyncGenerator[TimeBar, None]:
-        """Stream live closed time bars over WebSocket."""
         async for raw in self._connector.stream_klines(symbol, interval):
             yield to_time_bar(raw, symbol=symbol, interval=interval)
 
-    async def live_trades(
-        self,
-        symbol: str,
-    ) -> AsyncGenerator[Trade, None]:
-        """Stream live trades over WebSocket."""
+    async def _trade_stream(self, symbol: str) -> AsyncGenerator[Trade, None]:
         async for raw in self._connector.stream_trades(symbol):
             yield to_trade(raw, symbol=symbol)
 
-    # ----------------------------------------------------------------- helpers
-
     async def _recent_trades(self, symbol: str, *, limit: int) -> list[Trade]:
-        trades: list[Trade] = []
-        async for raw in self._connector.fetch_trades(symbol, limit=limit):
-            trades.append(to_trade(raw, symbol=symbol))
-        return trades
+        raws = await self._connector.fetch_trades_bulk(symbol, limit=limit)
+        return [to_trade(raw, symbol=symbol) for raw in raws]
 
     # ----------------------------------------------------------------- lifecycle
 
+    async def _warmup(self) -> None:
+        await self._connector.warmup()
+
     async def aclose(self) -> None:
+        await self._fanout.aclose()
         await self._connector.aclose()
-
-
-def _to_ms(dt: datetime) -> int:
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=UTC)
-    return int(dt.timestamp() * 1_000)
@@ -1,26 +1,41 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, AsyncIterator
+    from datetime import datetime
     from decimal import Decimal
 
-from datetime import UTC, datetime
+from functools import partial
 
+from clients._common import StreamFanout, feed_health, to_ms
 from data.connectors.binance_futures import BinanceFuturesConnector
 from data.connectors.types import KlineInterval
 from data.normalizers.bars import build_dollar_bars, build_tick_bars, build_volume_bars
-from data.normalizers.binance import to_trade
+from data.normalizers.binance import (
+    to_kline_arrays,
+    to_time_bar_from_row,
+    to_trade,
+)
 from data.normalizers.binance_futures import (
     to_current_funding_rate,
-    to_funding_rate,
+    to_funding_rates_from_rows,
     to_futures_time_bar,
 )
-from interfaces.client import BaseCryptoFuturesClient
+from interfaces.client import BaseCryptoFuturesClient, OverflowPolicy
 
 if TYPE_CHECKING:
-    from data.types import DollarBar, FundingRate, TickBar, TimeBar, Trade, VolumeBar
+    from data.normalizers.binance import KlineArrays
+    from data.types import (
+        DollarBar,
+        FeedHealth,
+        FundingRate,
+        TickBar,
+        TimeBar,
+        Trade,
+        VolumeBar,
+    )
 
 
 class BinanceFuturesClient(BaseCryptoFuturesClient):
@@ -63,11 +78,13 @@ class BinanceFuturesClient(BaseCryptoFuturesClient):
     intervals: ClassVar[list[KlineInterval]] = [KlineInterval.M1]
 
     def __init__(self, api_key: str | None = None) -> None:
+        super().__init__()
         self._connector = BinanceFuturesConnector(api_key)
+        self._fanout = StreamFanout()
 
     # ---------------------------------------------------------------- historical
 
-    async def time_bars(
+    async def _fetch_time_bars(
         self,
         symbol: str,
         interval: KlineInterval,
@@ -76,16 +93,40 @@ class BinanceFuturesClient(BaseCryptoFuturesClient):
         end: datetime,
     ) -> list[TimeBar]:
         """Fetch all closed futures time bars for *symbol* in [*start*, *end*]."""
+        normalize = partial(to_time_bar_from_row, symbol=symbol, interval=interval)
         bars: list[TimeBar] = []
-        async for raw in self._connector.fetch_klines(
+        async for page in self._connector.fetch_kline_pages(
             symbol,
             interval,
-            start_ms=_to_ms(start),
-            end_ms=_to_ms(end),
+            start_ms=to_ms(start),
+            end_ms=to_ms(end),
         ):
-            bars.append(to_futures_time_bar(raw, symbol=symbol, interval=interval))
+            bars.extend(map(normalize, page))
         return bars
 
+    async def time_bar_arrays(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start: datetime,
+        end: datetime,
+    ) -> KlineArrays:
+        """Fetch closed futures bars for *symbol* in [*start*, *end*] as column arrays.
+
+        Float64 fast path for research and backtests — see
+        :class:`~data.normalizers.binance.KlineArrays`.
+        """
+        rows: list[list[Any]] = []
+        async for page in self._connector.fetch_kline_pages(
+            symbol,
+            interval,
+            start_ms=to_ms(start),
+            end_ms=to_ms(end),
+        ):
+            rows.extend(page)
+        return to_kline_arrays(rows)
+
     async def funding_rates(
         self,
         symbol: str,
@@ -100,12 +141,12 @@ class BinanceFuturesClient(BaseCryptoFuturesClient):
         Results are ordered oldest-first.
         """
         rates: list[FundingRate] = []
-        async for raw in self._connector.fetch_funding_rates(
+        async for page in self._connector.fetch_funding_rate_pages(
             symbol,
-            start_ms=_to_ms(start),
-            end_ms=_to_ms(end) if end is not None else None,
+            start_ms=to_ms(start),
+            end_ms=to_ms(end) if end is not None else None,
         ):
-            rates.append(to_funding_rate(raw))
+            rates.extend(to_funding_rates_from_rows(page))
         return rates
 
     async def current_funding_rate(self, symbol: str) -> FundingRate:
@@ -148,21 +189,33 @@ class BinanceFuturesClient(BaseCryptoFuturesClient):
 
     # ---------------------------------------------------------------------- live
 
-    async def live_time_bars(
+    def live_time_bars(
         self,
         symbol: str,
         interval: KlineInterval,
-    ) -> AsyncGenerator[TimeBar, None]:
-        """Stream live closed futures time bars over WebSocket."""
-        async for raw in self._connector.stream_klines(symbol, interval):
-            yield to_futures_time_bar(raw, symbol=symbol, interval=interval)
+        *,
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[TimeBar]:
+        """Stream live closed futures time bars over WebSocket.
 
-    async def live_funding_rates(
+        Concurrent consumers of the same symbol and interval share one feed.
+        """
+        return self._fanout.subscribe(
+            ("klines", symbol, interval),
+            partial(self._time_bar_stream, symbol, interval),
+            max_lag=max_lag,
+            on_overflow=on_overflow,
+        )
+
+    def live_funding_rates(
         self,
         symbol: str,
         *,
         update_speed: int = 3,
-    ) -> AsyncGenerator[FundingRate, None]:
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[FundingRate]:
         """Stream live mark-price / funding-rate updates over WebSocket.
 
         Emits a :class:`~data.types.FundingRate` every *update_speed*
@@ -171,36 +224,74 @@ class BinanceFuturesClient(BaseCryptoFuturesClient):
 
         This is the preferred feed for a live funding-arb strategy because
         it lets the strategy react to intra-period funding rate changes
-        without polling the REST API.
+        without polling the REST API.  Concurrent consumers of the same
+        symbol and update speed share one feed.
+        """
+        return self._fanout.subscribe(
+            ("mark_price", symbol, update_speed),
+            partial(self._funding_rate_stream, symbol, update_speed),
+            max_lag=max_lag,
+            on_overflow=on_overflow,
+        )
+
+    def live_trades(
+        self,
+        symbol: str,
+        *,
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[Trade]:
+        """Stream live futures trades over WebSocket.
+
+        Concurrent consumers of the same symbol share one feed.
         """
+        return self._fanout.subscribe(
+            ("trades", symbol),
+            partial(self._trade_stream, symbol),
+            max_lag=max_lag,
+            on_overflow=on_overflow,
+        )
+
+    @property
+    def lag_events(self) -> int:
+        return self._fanout.lag_events + self._connector.dropped_events
+
+    async def feed_health(self, symbol: str) -> FeedHealth:
+        return feed_health(
+            symbol,
+            self._connector.last_message(symbol),
+            self._connector.reconnects,
+        )
+
+    # ----------------------------------------------------------------- helpers
+
+    async def _time_bar_stream(
+        self, symbol: str, interval: KlineInterval
+    ) -> AsyncGenerator[TimeBar, None]:
+        async for raw in self._connector.stream_klines(symbol, interval):
+            yield to_futures_time_bar(raw, symbol=symbol, interval=interval)
+
+    async def _funding_rate_stream(
+        self, symbol: str, update_speed: int
+    ) -> AsyncGenerator[FundingRate, None]:
         async for raw in self._connector.stream_mark_price(
             symbol, update_speed=update_speed
         ):
             yield to_current_funding_rate(raw)
 
-    async def live_trades(
-        self,
-        symbol: str,
-    ) -> AsyncGenerator[Trade, None]:
-        """Stream live futures trades over WebSocket."""
+    async def _trade_stream(self, symbol: str) -> AsyncGenerator[Trade, None]:
         async for raw in self._connector.stream_trades(symbol):
             yield to_trade(raw, symbol=symbol)
 
-    # ----------------------------------------------------------------- helpers
-
     async def _recent_trades(self, symbol: str, *, limit: int) -> list[Trade]:
-        trades: list[Trade] = []
-        async for raw in self._connector.fetch_trades(symbol, limit=limit):
-            trades.append(to_trade(raw, symbol=symbol))
-        return trades
+        raws = await self._connector.fetch_trades_bulk(symbol, limit=limit)
+        return [to_trade(raw, symbol=symbol) for raw in raws]
 
     # ----------------------------------------------------------------- lifecycle
 
+    async def _warmup(self) -> None:
+        await self._connector.warmup()
+
     async def aclose(self) -> None:
+        await self._fanout.aclose()
         await self._connector.aclose()
-
-
-def _to_ms(dt: datetime) -> int:
-    if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=UTC)
-    return int(dt.timestamp() * 1_000)
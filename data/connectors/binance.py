@@ -1,18 +1,41 @@
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, overload
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
-from decimal import Decimal
+    from collections.abc import AsyncGenerator, Callable
+
+    from websockets.asyncio.client import ClientConnection
 
 import httpx
+import orjson
 import websockets
 
 from data.connectors.types import KlineInterval, RawKline, RawTrade
 
 _KLINE_PAGE = 1_000  # Binance maximum klines per REST request
+_MAX_CONCURRENT_PAGES = 8  # in-flight kline pages; keeps request weight bounded
+_PROBE_TIMEOUT = 2.0  # seconds allowed for one REST mirror latency probe
+_STREAM_BUFFER = 1_024  # undelivered events kept per subscriber before dropping
+_MAX_RECONNECT_ATTEMPTS = 8  # consecutive failures before a stream session gives up
+_RECONNECT_MIN_DELAY = 0.5  # seconds; doubled after every failed attempt
+_RECONNECT_MAX_DELAY = 30.0
+_KLINE_EVENT = b'"e":"kline"'
+_OPEN_KLINE = b'"x":false'  # kline payload flag for a bar that is still forming
+
+log = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_Q = TypeVar("_Q")
+
+_ClientKey = tuple[str, frozenset[tuple[str, str]], float, bool]  # (..., pinned)
+_CLIENTS: dict[_ClientKey, httpx.AsyncClient] = {}
+_CLIENT_REFS: dict[httpx.AsyncClient, int] = {}
 
 
 class BinanceConnector:
@@ -37,25 +60,60 @@ class BinanceConnector:
     """
 
     _REST_BASE = "https://api.binance.com"
-    _WS_BASE = "wss://stream.binance.com:9443/ws"
+    _REST_MIRRORS: ClassVar[tuple[str, ...]] = (
+        "https://api.binance.com",
+        "https://api1.binance.com",
+        "https://api2.binance.com",
+        "https://api3.binance.com",
+        "https://api4.binance.com",
+        "https://api-gcp.binance.com",
+    )
+    _PING_PATH = "/api/v3/ping"
+    _WS_BASE = "wss://stream.binance.com:9443/stream"
 
     def __init__(
         self,
         api_key: str | None = None,
         *,
         timeout: float = 10.0,
+        select_fastest_rest: bool = True,
     ) -> None:
         headers: dict[str, str] = {}
         if api_key:
             headers["X-MBX-APIKEY"] = api_key
-        self._client = httpx.AsyncClient(
-            base_url=self._REST_BASE,
+        self._client = acquire_http_client(
+            self._REST_BASE,
             headers=headers,
             timeout=timeout,
+            pinned=not select_fastest_rest,
         )
+        self._rest_selected = not select_fastest_rest
+        self._closed = False
+        self._streams = MultiStreamSession(self._WS_BASE)
 
     # ------------------------------------------------------------------ REST
 
+    @overload
+    def fetch_klines(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start_ms: int,
+        end_ms: int,
+    ) -> AsyncGenerator[RawKline, None]: ...
+
+    @overload
+    def fetch_klines(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start_ms: int,
+        end_ms: int,
+        normalizer: Callable[[list[Any]], _T],
+    ) -> AsyncGenerator[_T, None]: ...
+
     async def fetch_klines(
         self,
         symbol: str,
@@ -63,32 +121,88 @@ class BinanceConnector:
         *,
         start_ms: int,
         end_ms: int,
-    ) -> AsyncGenerator[RawKline, None]:
+        normalizer: Callable[[list[Any]], Any] | None = None,
+    ) -> AsyncGenerator[Any, None]:
         """Yield all closed klines in [start_ms, end_ms], auto-paginating.
 
-        Binance caps responses at 1 000 klines per request; this method
-        transparently issues as many requests as needed to cover the range.
+        Thin row-at-a-time adapter over :meth:`fetch_kline_pages`.  Each REST
+        row is passed through *normalizer* — by default it becomes a
+        :class:`~data.connectors.types.RawKline`; callers that want canonical
+        types can pass e.g. :func:`~data.normalizers.binance.to_time_bar_from_row`
+        and skip the intermediate struct entirely.
         """
-        cursor = start_ms
-        while cursor < end_ms:
-            response = await self._client.get(
-                "/api/v3/klines",
-                params={
-                    "symbol": symbol,
-                    "interval": interval.value,
-                    "startTime": cursor,
-                    "endTime": end_ms,
-                    "limit": _KLINE_PAGE,
-                },
+        parse = normalizer or _parse_rest_kline
+        async for page in self.fetch_kline_pages(
+            symbol, interval, start_ms=start_ms, end_ms=end_ms
+        ):
+            for row in page:
+                yield parse(row)
+
+    async def fetch_kline_pages(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start_ms: int,
+        end_ms: int,
+    ) -> AsyncGenerator[list[list[Any]], None]:
+        """Yield raw kline pages covering [start_ms, end_ms], in order.
+
+        Each page is the decoded REST payload — a list of up to 1 000 kline
+        rows in Binance's array layout — so bulk consumers can build their
+        output in one sweep per page instead of one struct per row.
+
+        Binance caps responses at 1 000 klines per request.  The first page
+        is fetched on its own; if the range needs more, the remainder is split
+        into windows of 1 000 intervals which are requested concurrently,
+        ``_MAX_CONCURRENT_PAGES`` at a time.
+        """
+        await self._select_fastest_rest()
+        # fixed query prefix, encoded once and reused by every page request
+        base_params = (
+            ("symbol", symbol),
+            ("interval", interval.value),
+            ("limit", str(_KLINE_PAGE)),
+        )
+        first = await self._kline_page(base_params, start_ms, end_ms)
+        yield first
+        if len(first) < _KLINE_PAGE:
+            return
+
+        # resume past the close time of the last bar
+        cursor = int(first[-1][6]) + 1
+        window = _KLINE_PAGE * interval.ms
+        starts = range(cursor, end_ms, window)
+        for i in range(0, len(starts), _MAX_CONCURRENT_PAGES):
+            pages = await asyncio.gather(
+                *(
+                    self._kline_page(
+                        base_params, start, min(start + window - 1, end_ms)
+                    )
+                    for start in starts[i : i + _MAX_CONCURRENT_PAGES]
+                )
             )
+            for page in pages:
+                yield page
+
+    async def _kline_page(
+        self,
+        base_params: tuple[tuple[str, str], ...],
+        start_ms: int,
+        end_ms: int,
+    ) -> list[list[Any]]:
+        response = await self._client.get(
+            "/api/v3/klines",
+            params=(
+                *base_params,
+                ("startTime", str(start_ms)),
+                ("endTime", str(end_ms)),
+            ),
+        )
+        if response.status_code != 200:
             response.raise_for_status()
-            batch: list[list[Any]] = response.json()
-            for row in batch:
-                yield _parse_rest_kline(row)
-            if len(batch) < _KLINE_PAGE:
-                break
-            # advance cursor past the close time of the last bar
-            cursor = int(batch[-1][6]) + 1
+        page: list[list[Any]] = orjson.loads(response.content)
+        return page
 
     async def fetch_trades(
         self,
@@ -97,13 +211,27 @@ class BinanceConnector:
         limit: int = 1_000,
     ) -> AsyncGenerator[RawTrade, None]:
         """Yield recent trades for *symbol* (up to *limit*, max 1 000)."""
+        for raw in await self.fetch_trades_bulk(symbol, limit=limit):
+            yield raw
+
+    async def fetch_trades_bulk(
+        self,
+        symbol: str,
+        *,
+        limit: int = 1_000,
+    ) -> list[RawTrade]:
+        """Return recent trades for *symbol* as a list in a single await.
+
+        Prefer this over :meth:`fetch_trades` when the whole batch is needed
+        anyway — it skips one async-generator round trip per row.
+        """
         response = await self._client.get(
             "/api/v3/trades",
             params={"symbol": symbol, "limit": limit},
         )
-        response.raise_for_status()
-        for row in response.json():
-            yield _parse_rest_trade(row)
+        if response.status_code != 200:
+            response.raise_for_status()
+        return [_parse_rest_trade(row) for row in orjson.loads(response.content)]
 
     # ------------------------------------------------------------ WebSocket
 
@@ -116,38 +244,414 @@ class BinanceConnector:
 
         Binance sends partial updates while a bar is forming; this method
         filters them out and only yields once the bar is marked closed.
+        All streams of this connector share one WebSocket connection.
         """
-        url = f"{self._WS_BASE}/{symbol.lower()}@kline_{interval.value}"
-        async with websockets.connect(url) as ws:  # type: ignore[attr-defined]
-            async for message in ws:
-                data: dict[str, Any] = json.loads(message)
-                k = data["k"]
-                if k["x"]:  # x == True → bar is closed
-                    yield _parse_ws_kline(k)
+        stream = f"{symbol.lower()}@kline_{interval.value}"
+        async for data in self._streams.stream(stream):
+            k = data["k"]
+            if k["x"]:  # x == True → bar is closed
+                yield _parse_ws_kline(k)
 
     async def stream_trades(
         self,
         symbol: str,
     ) -> AsyncGenerator[RawTrade, None]:
         """Yield a :class:`RawTrade` for every executed trade over WebSocket."""
-        url = f"{self._WS_BASE}/{symbol.lower()}@trade"
-        async with websockets.connect(url) as ws:  # type: ignore[attr-defined]
-            async for message in ws:
-                data: dict[str, Any] = json.loads(message)
-                yield _parse_ws_trade(data)
+        async for data in self._streams.stream(f"{symbol.lower()}@trade"):
+            yield _parse_ws_trade(data)
+
+    async def _select_fastest_rest(self) -> None:
+        """Point the REST client at the lowest-latency mirror, once.
+
+        Runs lazily before the first bulk download.  The client is shared by
+        every connector with the same configuration, so they all follow.
+        """
+        if self._rest_selected:
+            return
+        self._rest_selected = True
+        fastest = await fastest_base_url(
+            self._client, self._REST_MIRRORS, self._PING_PATH
+        )
+        if fastest is not None:
+            self._client.base_url = fastest
+
+    def last_message(self, symbol: str) -> tuple[int, int | None] | None:
+        """``(monotonic_ns, skew_ms)`` of *symbol*'s freshest WebSocket event.
+
+        ``None`` until the first event for *symbol* arrives.
+        """
+        return self._streams.last_seen(f"{symbol.lower()}@")
+
+    @property
+    def reconnects(self) -> int:
+        """Transparent reconnects of the shared WebSocket connection."""
+        return self._streams.reconnects
+
+    @property
+    def dropped_events(self) -> int:
+        """WebSocket events dropped because a stream consumer fell behind."""
+        return self._streams.dropped
 
     # ----------------------------------------------------------------- lifecycle
 
+    async def warmup(self) -> None:
+        """Open the REST connection now rather than on the first request.
+
+        Selects the fastest mirror (if enabled) and pings it, so the TCP,
+        TLS and HTTP/2 setup is paid here instead of by the first download.
+        A failed ping is ignored; the first real request will retry.
+        """
+        await self._select_fastest_rest()
+        with contextlib.suppress(httpx.HTTPError):
+            await self._client.get(self._PING_PATH)
+
     async def aclose(self) -> None:
-        await self._client.aclose()
+        if self._closed:
+            return
+        self._closed = True
+        await self._streams.aclose()
+        await release_http_client(self._client)
 
     async def __aenter__(self) -> BinanceConnector:
+        await self.warmup()
         return self
 
     async def __aexit__(self, *_: object) -> None:
         await self.aclose()
 
 
+# ------------------------------------------------------------ shared HTTP pool
+
+
+def acquire_http_client(
+    base_url: str,
+    *,
+    headers: dict[str, str],
+    timeout: float,
+    pinned: bool = False,
+) -> httpx.AsyncClient:
+    """Return the process-wide :class:`httpx.AsyncClient` for *base_url*.
+
+    Connectors with the same base URL, headers (API key included) and timeout
+    share one client — and therefore one connection pool — so constructing a
+    connector per symbol does not pay a fresh TLS handshake each time.  Every
+    call must be paired with :func:`release_http_client`.
+
+    Unpinned clients may be moved to a faster mirror by any connector sharing
+    them; *pinned* ones live in a separate pool whose base URL never changes.
+    """
+    key = (base_url, frozenset(headers.items()), timeout, pinned)
+    client = _CLIENTS.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=32,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _CLIENTS[key] = client
+    _CLIENT_REFS[client] = _CLIENT_REFS.get(client, 0) + 1
+    return client
+
+
+async def release_http_client(client: httpx.AsyncClient) -> None:
+    """Drop one reference to *client*, closing it when the last one goes."""
+    refs = _CLIENT_REFS.pop(client, 0) - 1
+    if refs > 0:
+        _CLIENT_REFS[client] = refs
+        return
+    for key, shared in list(_CLIENTS.items()):
+        if shared is client:
+            del _CLIENTS[key]
+    await client.aclose()
+
+
+async def fastest_base_url(
+    client: httpx.AsyncClient, bases: tuple[str, ...], path: str
+) -> str | None:
+    """Return the entry of *bases* that answers ``GET <base><path>`` fastest.
+
+    All candidates are probed concurrently through *client*, so the winner's
+    connection is already warm when it is adopted.  Mirrors that fail or time
+    out are ignored; ``None`` is returned if none of them answered.
+    """
+
+    async def round_trip(base: str) -> float:
+        started = time.perf_counter()
+        try:
+            response = await client.get(base + path, timeout=_PROBE_TIMEOUT)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            return math.inf
+        return time.perf_counter() - started
+
+    timings = await asyncio.gather(*map(round_trip, bases))
+    best = min(range(len(bases)), key=timings.__getitem__)
+    return bases[best] if timings[best] < math.inf else None
+
+
+# ---------------------------------------------------------- shared WebSocket
+
+
+class MultiStreamSession:
+    """Multiplexes many Binance streams over a single WebSocket connection.
+
+    Connects to a combined-stream endpoint (``.../stream``) and manages
+    ``<symbol>@<channel>`` subscriptions with ``SUBSCRIBE`` / ``UNSUBSCRIBE``
+    frames, so N symbols cost one TLS handshake instead of N.  Combined
+    streams wrap every event as ``{"stream": ..., "data": ...}``; each frame
+    is decoded once and its ``data`` is routed to the queue of every
+    subscriber of that stream.
+
+    Each subscriber gets a bounded buffer of *buffer* events.  When a slow
+    consumer lets it fill up, the oldest event is dropped to make room —
+    stale ticks are worthless, and an unbounded buffer would grow until the
+    process runs out of memory.
+
+    The connection is opened lazily on the first subscription and then owned
+    by a supervisor task.  When it drops — a network blip, a missed
+    keep-alive pong, or Binance's routine 24-hour disconnect — the supervisor
+    reopens it with exponential backoff and resubscribes every active stream,
+    so open :meth:`stream` generators simply resume.  Events sent while the
+    link was down are lost.  Only after *max_retries* consecutive failed
+    attempts does the session give up, ending every stream with the last
+    connection error.
+
+    Usage::
+
+        session = MultiStreamSession("wss://stream.binance.com:9443/stream")
+        async for event in session.stream("btcusdt@trade"):
+            ...
+        await session.aclose()
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        buffer: int = _STREAM_BUFFER,
+        max_retries: int = _MAX_RECONNECT_ATTEMPTS,
+    ) -> None:
+        self._url = url
+        self._buffer = buffer
+        self._max_retries = max_retries
+        self._ws: ClientConnection | None = None
+        self._supervisor: asyncio.Task[None] | None = None
+        self._error: Exception | None = None
+        # None is the end-of-stream sentinel pushed when the session ends
+        self._queues: dict[str, list[asyncio.Queue[dict[str, Any] | None]]] = {}
+        self._lock = asyncio.Lock()
+        self._request_id = 0
+        self._reconnects = 0
+        self._dropped = 0
+        # stream -> (monotonic ns at receipt, local minus event time in ms)
+        self._last_seen: dict[str, tuple[int, int | None]] = {}
+
+    @property
+    def reconnects(self) -> int:
+        """Number of times the connection has been transparently reopened."""
+        return self._reconnects
+
+    @property
+    def dropped(self) -> int:
+        """Events discarded because a subscriber's buffer was full."""
+        return self._dropped
+
+    def last_seen(self, prefix: str) -> tuple[int, int | None] | None:
+        """Freshest ``(monotonic_ns, skew_ms)`` of streams starting with *prefix*.
+
+        ``None`` if no such stream has delivered an event yet.  Partial kline
+        updates are dropped unparsed, so a kline stream only registers once
+        per closed bar.
+        """
+        seen = [v for k, v in self._last_seen.items() if k.startswith(prefix)]
+        return max(seen, key=lambda v: v[0]) if seen else None
+
+    async def stream(self, stream: str) -> AsyncGenerator[dict[str, Any], None]:
+        """Subscribe to *stream* and yield its decoded events."""
+        queue = await self.subscribe(stream)
+        try:
+            while True:
+                event = await queue.get()
+                if event is None:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                yield event
+        finally:
+            await self.unsubscribe(stream, queue)
+
+    async def subscribe(self, stream: str) -> asyncio.Queue[dict[str, Any] | None]:
+        """Return a new queue fed with every event of *stream*."""
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue(self._buffer)
+        async with self._lock:
+            subscribers = self._queues.setdefault(stream, [])
+            subscribers.append(queue)
+            try:
+                if self._supervisor is None:
+                    self._ws = await self._connect()
+                    self._error = None
+                    self._supervisor = asyncio.create_task(self._supervise())
+                elif self._ws is not None and len(subscribers) == 1:
+                    await self._send(self._ws, "SUBSCRIBE", [stream])
+                # else: reconnecting — the new connection subscribes it
+            except BaseException:
+                subscribers.remove(queue)
+                if not subscribers:
+                    del self._queues[stream]
+                raise
+        return queue
+
+    async def unsubscribe(
+        self, stream: str, queue: asyncio.Queue[dict[str, Any] | None]
+    ) -> None:
+        """Detach *queue*; the stream is dropped once its last queue leaves."""
+        async with self._lock:
+            subscribers = self._queues.get(stream)
+            if subscribers is None:
+                return
+            with contextlib.suppress(ValueError):
+                subscribers.remove(queue)
+            if subscribers:
+                return
+            del self._queues[stream]
+            self._last_seen.pop(stream, None)
+            if self._ws is not None:
+                with contextlib.suppress(websockets.ConnectionClosed):
+                    await self._send(self._ws, "UNSUBSCRIBE", [stream])
+
+    async def aclose(self) -> None:
+        """Close the connection and end every open stream."""
+        ws, supervisor = self._ws, self._supervisor
+        if supervisor is not None:
+            supervisor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await supervisor
+        if ws is not None:
+            await ws.close()
+
+    async def _connect(self) -> ClientConnection:
+        """Open a connection and subscribe every stream that has listeners."""
+        ws = await websockets.connect(
+            self._url,
+            # frames are small JSON events; inflating each one costs more
+            # CPU than the bandwidth it saves
+            compression=None,
+            max_size=2**18,
+            # Binance pings us; our own keep-alive only needs to catch
+            # a dead link eventually
+            ping_interval=180,
+            ping_timeout=600,
+            close_timeout=1,
+        )
+        if self._queues:
+            await self._send(ws, "SUBSCRIBE", list(self._queues))
+        return ws
+
+    async def _reconnect(self) -> ClientConnection | None:
+        """Reopen the connection with exponential backoff.
+
+        Returns ``None`` when nobody is subscribed any more, so there is
+        nothing to reconnect for.
+        """
+        error: Exception | None = None
+        for attempt in range(self._max_retries):
+            await asyncio.sleep(
+                min(_RECONNECT_MAX_DELAY, _RECONNECT_MIN_DELAY * 2**attempt)
+            )
+            async with self._lock:
+                if not self._queues:
+                    return None
+                try:
+                    self._ws = await self._connect()
+                except (OSError, websockets.InvalidHandshake) as exc:
+                    log.warning(
+                        "%s: reconnect attempt %d failed: %r",
+                        self._url,
+                        attempt + 1,
+                        exc,
+                    )
+                    error = exc
+                    continue
+                self._reconnects += 1
+                log.info("%s: reconnected (%d total)", self._url, self._reconnects)
+                return self._ws
+        msg = f"{self._url}: gave up after {self._max_retries} reconnect attempts"
+        raise ConnectionError(msg) from error
+
+    async def _send(
+        self, ws: ClientConnection, method: str, streams: list[str]
+    ) -> None:
+        self._request_id += 1
+        request = {"method": method, "params": streams, "id": self._request_id}
+        await ws.send(orjson.dumps(request).decode())
+
+    async def _supervise(self) -> None:
+        ws = self._ws
+        try:
+            while ws is not None:
+                try:
+                    await self._read_loop(ws)
+                except websockets.ConnectionClosed as exc:
+                    log.warning("%s: connection lost: %s", self._url, exc)
+                self._ws = None
+                ws = await self._reconnect()
+        except Exception as exc:
+            self._error = exc
+        finally:
+            self._ws = None
+            self._supervisor = None
+            for subscribers in self._queues.values():
+                for queue in subscribers:
+                    _put_drop_oldest(queue, None)
+            self._queues.clear()
+
+    async def _read_loop(self, ws: ClientConnection) -> None:
+        while True:
+            # Raw bytes: skips UTF-8 decoding and allows a byte-level
+            # pre-filter.  Partial kline updates make up the bulk of
+            # kline traffic and no consumer wants them, so they are
+            # dropped before any JSON parsing or dict allocation.
+            message = await ws.recv(decode=False)
+            if _OPEN_KLINE in message and _KLINE_EVENT in message:
+                continue
+            # one bad frame must not end every stream sharing the socket;
+            # only connection errors reach the supervisor
+            try:
+                self._route(message)
+            except (ValueError, LookupError, TypeError, AttributeError):
+                log.exception("%s: dropped malformed frame %r", self._url, message)
+
+    def _route(self, message: bytes) -> None:
+        """Decode one combined-stream frame and queue its event."""
+        frame: dict[str, Any] = orjson.loads(message)
+        stream = frame.get("stream")
+        if stream is None:
+            return  # SUBSCRIBE / UNSUBSCRIBE acknowledgement
+        data = frame["data"]
+        event_ms = data.get("E")
+        self._last_seen[stream] = (
+            time.monotonic_ns(),
+            time.time_ns() // 1_000_000 - event_ms if event_ms else None,
+        )
+        for queue in self._queues.get(stream, ()):
+            if queue.full():
+                queue.get_nowait()
+                self._dropped += 1
+            queue.put_nowait(data)
+
+
+def _put_drop_oldest(queue: asyncio.Queue[_Q], item: _Q) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
 # ------------------------------------------------------------------ parsers
 
 
@@ -195,13 +699,12 @@ def _parse_rest_trade(row: dict[str, Any]) -> RawTrade:
 
 
 def _parse_ws_trade(data: dict[str, Any]) -> RawTrade:
-    # WS trade stream omits quoteQty — compute it from price × qty
-    quote_qty = str(Decimal(data["p"]) * Decimal(data["q"]))
+    # WS trade stream omits quoteQty; left unset instead of computing it per tick
     return RawTrade(
         id=data["t"],
         price=data["p"],
         qty=data["q"],
-        quote_qty=quote_qty,
+        quote_qty=None,
         time=data["T"],
         is_buyer_maker=data["m"],
     )
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, overload
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Callable
 
 import httpx
-import websockets
+import orjson
 
+from data.connectors.binance import (
+    MultiStreamSession,
+    acquire_http_client,
+    fastest_base_url,
+    release_http_client,
+)
 from data.connectors.types import (
     KlineInterval,
     RawFundingRate,
@@ -19,6 +26,9 @@ from data.connectors.types import (
 
 _KLINE_PAGE = 1_000  # Binance max klines per request
 _FUNDING_PAGE = 1_000  # Binance max funding records per request
+_MAX_CONCURRENT_PAGES = 8  # in-flight kline pages; keeps request weight bounded
+
+_T = TypeVar("_T")
 
 
 class BinanceFuturesConnector:
@@ -48,25 +58,59 @@ class BinanceFuturesConnector:
     """
 
     _REST_BASE = "https://fapi.binance.com"
-    _WS_BASE = "wss://fstream.binance.com/ws"
+    _REST_MIRRORS: ClassVar[tuple[str, ...]] = (
+        "https://fapi.binance.com",
+        "https://fapi1.binance.com",
+        "https://fapi2.binance.com",
+        "https://fapi3.binance.com",
+        "https://fapi4.binance.com",
+    )
+    _PING_PATH = "/fapi/v1/ping"
+    _WS_BASE = "wss://fstream.binance.com/stream"
 
     def __init__(
         self,
         api_key: str | None = None,
         *,
         timeout: float = 10.0,
+        select_fastest_rest: bool = True,
     ) -> None:
         headers: dict[str, str] = {}
         if api_key:
             headers["X-MBX-APIKEY"] = api_key
-        self._client = httpx.AsyncClient(
-            base_url=self._REST_BASE,
+        self._client = acquire_http_client(
+            self._REST_BASE,
             headers=headers,
             timeout=timeout,
+            pinned=not select_fastest_rest,
         )
+        self._rest_selected = not select_fastest_rest
+        self._closed = False
+        self._streams = MultiStreamSession(self._WS_BASE)
 
     # ------------------------------------------------------------------ REST
 
+    @overload
+    def fetch_klines(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start_ms: int,
+        end_ms: int,
+    ) -> AsyncGenerator[RawKline, None]: ...
+
+    @overload
+    def fetch_klines(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start_ms: int,
+        end_ms: int,
+        normalizer: Callable[[list[Any]], _T],
+    ) -> AsyncGenerator[_T, None]: ...
+
     async def fetch_klines(
         self,
         symbol: str,
@@ -74,33 +118,87 @@ class BinanceFuturesConnector:
         *,
         start_ms: int,
         end_ms: int,
-    ) -> AsyncGenerator[RawKline, None]:
+        normalizer: Callable[[list[Any]], Any] | None = None,
+    ) -> AsyncGenerator[Any, None]:
         """Yield all closed futures klines in [*start_ms*, *end_ms*].
 
-        Auto-paginates in batches of 1 000 — Binance's per-request cap.
+        Thin row-at-a-time adapter over :meth:`fetch_kline_pages`.  Each REST
+        row is passed through *normalizer* — by default it becomes a
+        :class:`~data.connectors.types.RawKline`; callers that want canonical
+        types can pass e.g. :func:`~data.normalizers.binance.to_time_bar_from_row`
+        and skip the intermediate struct entirely.
         The kline payload is structurally identical to spot, so the same
-        :class:`~data.connectors.types.RawKline` TypedDict is reused.
+        :class:`~data.connectors.types.RawKline` struct is reused.
         """
-        cursor = start_ms
-        while cursor < end_ms:
-            response = await self._client.get(
-                "/fapi/v1/klines",
-                params={
-                    "symbol": symbol,
-                    "interval": interval.value,
-                    "startTime": cursor,
-                    "endTime": end_ms,
-                    "limit": _KLINE_PAGE,
-                },
+        parse = normalizer or _parse_rest_kline
+        async for page in self.fetch_kline_pages(
+            symbol, interval, start_ms=start_ms, end_ms=end_ms
+        ):
+            for row in page:
+                yield parse(row)
+
+    async def fetch_kline_pages(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start_ms: int,
+        end_ms: int,
+    ) -> AsyncGenerator[list[list[Any]], None]:
+        """Yield raw futures kline pages covering [*start_ms*, *end_ms*], in order.
+
+        Each page is the decoded REST payload — a list of up to 1 000 kline
+        rows in Binance's array layout.  Auto-paginates in batches of 1 000 —
+        Binance's per-request cap.  After the first page, the remaining range
+        is split into windows of 1 000 intervals fetched concurrently,
+        ``_MAX_CONCURRENT_PAGES`` at a time.
+        """
+        await self._select_fastest_rest()
+        # fixed query prefix, encoded once and reused by every page request
+        base_params = (
+            ("symbol", symbol),
+            ("interval", interval.value),
+            ("limit", str(_KLINE_PAGE)),
+        )
+        first = await self._kline_page(base_params, start_ms, end_ms)
+        yield first
+        if len(first) < _KLINE_PAGE:
+            return
+
+        # resume past the close time of the last bar
+        cursor = int(first[-1][6]) + 1
+        window = _KLINE_PAGE * interval.ms
+        starts = range(cursor, end_ms, window)
+        for i in range(0, len(starts), _MAX_CONCURRENT_PAGES):
+            pages = await asyncio.gather(
+                *(
+                    self._kline_page(
+                        base_params, start, min(start + window - 1, end_ms)
+                    )
+                    for start in starts[i : i + _MAX_CONCURRENT_PAGES]
+                )
             )
+            for page in pages:
+                yield page
+
+    async def _kline_page(
+        self,
+        base_params: tuple[tuple[str, str], ...],
+        start_ms: int,
+        end_ms: int,
+    ) -> list[list[Any]]:
+        response = await self._client.get(
+            "/fapi/v1/klines",
+            params=(
+                *base_params,
+                ("startTime", str(start_ms)),
+                ("endTime", str(end_ms)),
+            ),
+        )
+        if response.status_code != 200:
             response.raise_for_status()
-            batch: list[list[Any]] = response.json()
-            for row in batch:
-                yield _parse_rest_kline(row)
-            if len(batch) < _KLINE_PAGE:
-                break
-            # advance cursor past the close time of the last bar
-            cursor = int(batch[-1][6]) + 1
+        page: list[list[Any]] = orjson.loads(response.content)
+        return page
 
     async def fetch_funding_rates(
         self,
@@ -112,26 +210,47 @@ class BinanceFuturesConnector:
         """Yield historical funding rates for *symbol* from *start_ms*.
 
         Binance settles funding every 8 hours.  Each record represents one
-        settlement.  The endpoint is paginated via ``startTime``; this method
-        advances the cursor automatically until all records are returned or
-        *end_ms* is reached.
+        settlement.  Thin row-at-a-time adapter over
+        :meth:`fetch_funding_rate_pages`.
         """
+        async for page in self.fetch_funding_rate_pages(
+            symbol, start_ms=start_ms, end_ms=end_ms
+        ):
+            for row in page:
+                yield _parse_funding_rate(row)
+
+    async def fetch_funding_rate_pages(
+        self,
+        symbol: str,
+        *,
+        start_ms: int,
+        end_ms: int | None = None,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Yield raw funding-rate pages for *symbol* from *start_ms*, in order.
+
+        Each page is the decoded REST payload (up to 1 000 records).  The
+        endpoint is paginated via ``startTime``; this method advances the
+        cursor automatically until all records are returned or *end_ms* is
+        reached.
+        """
+        await self._select_fastest_rest()
+        base_params: tuple[tuple[str, str], ...] = (
+            ("symbol", symbol),
+            ("limit", str(_FUNDING_PAGE)),
+        )
+        if end_ms is not None:
+            base_params += (("endTime", str(end_ms)),)
+
         cursor = start_ms
         while True:
-            params: dict[str, Any] = {
-                "symbol": symbol,
-                "startTime": cursor,
-                "limit": _FUNDING_PAGE,
-            }
-            if end_ms is not None:
-                params["endTime"] = end_ms
-
-            response = await self._client.get("/fapi/v1/fundingRate", params=params)
-            response.raise_for_status()
-            batch: list[dict[str, Any]] = response.json()
-
-            for row in batch:
-                yield _parse_funding_rate(row)
+            response = await self._client.get(
+                "/fapi/v1/fundingRate",
+                params=(*base_params, ("startTime", str(cursor))),
+            )
+            if response.status_code != 200:
+                response.raise_for_status()
+            batch: list[dict[str, Any]] = orjson.loads(response.content)
+            yield batch
 
             if len(batch) < _FUNDING_PAGE:
                 break
@@ -147,8 +266,9 @@ class BinanceFuturesConnector:
         response = await self._client.get(
             "/fapi/v1/premiumIndex", params={"symbol": symbol}
         )
-        response.raise_for_status()
-        data: dict[str, Any] = response.json()
+        if response.status_code != 200:
+            response.raise_for_status()
+        data: dict[str, Any] = orjson.loads(response.content)
         return _parse_mark_price(data)
 
     async def fetch_trades(
@@ -158,13 +278,27 @@ class BinanceFuturesConnector:
         limit: int = 1_000,
     ) -> AsyncGenerator[RawTrade, None]:
         """Yield recent futures trades for *symbol* (up to *limit*, max 1 000)."""
+        for raw in await self.fetch_trades_bulk(symbol, limit=limit):
+            yield raw
+
+    async def fetch_trades_bulk(
+        self,
+        symbol: str,
+        *,
+        limit: int = 1_000,
+    ) -> list[RawTrade]:
+        """Return recent futures trades for *symbol* as a list in a single await.
+
+        Prefer this over :meth:`fetch_trades` when the whole batch is needed
+        anyway — it skips one async-generator round trip per row.
+        """
         response = await self._client.get(
             "/fapi/v1/trades",
             params={"symbol": symbol, "limit": limit},
         )
-        response.raise_for_status()
-        for row in response.json():
-            yield _parse_rest_trade(row)
+        if response.status_code != 200:
+            response.raise_for_status()
+        return [_parse_rest_trade(row) for row in orjson.loads(response.content)]
 
     # ------------------------------------------------------------ WebSocket
 
@@ -176,14 +310,13 @@ class BinanceFuturesConnector:
         """Yield a :class:`RawKline` for each *closed* futures bar over WebSocket.
 
         Only emits once Binance marks the bar closed (``x == True``).
+        All streams of this connector share one WebSocket connection.
         """
-        url = f"{self._WS_BASE}/{symbol.lower()}@kline_{interval.value}"
-        async with websockets.connect(url) as ws:  # type: ignore[attr-defined]
-            async for message in ws:
-                data: dict[str, Any] = json.loads(message)
-                k = data["k"]
-                if k["x"]:  # x == True → bar is closed
-                    yield _parse_ws_kline(k)
+        stream = f"{symbol.lower()}@kline_{interval.value}"
+        async for data in self._streams.stream(stream):
+            k = data["k"]
+            if k["x"]:  # x == True → bar is closed
+                yield _parse_ws_kline(k)
 
     async def stream_mark_price(
         self,
@@ -203,29 +336,71 @@ class BinanceFuturesConnector:
                 the standard 3-second cadence.
         """
         suffix = "" if update_speed == 3 else "@1s"
-        url = f"{self._WS_BASE}/{symbol.lower()}@markPrice{suffix}"
-        async with websockets.connect(url) as ws:  # type: ignore[attr-defined]
-            async for message in ws:
-                data: dict[str, Any] = json.loads(message)
-                yield _parse_ws_mark_price(data)
+        async for data in self._streams.stream(f"{symbol.lower()}@markPrice{suffix}"):
+            yield _parse_ws_mark_price(data)
 
     async def stream_trades(
         self,
         symbol: str,
     ) -> AsyncGenerator[RawTrade, None]:
         """Yield a :class:`RawTrade` for every futures trade over WebSocket."""
-        url = f"{self._WS_BASE}/{symbol.lower()}@trade"
-        async with websockets.connect(url) as ws:  # type: ignore[attr-defined]
-            async for message in ws:
-                data: dict[str, Any] = json.loads(message)
-                yield _parse_ws_trade(data)
+        async for data in self._streams.stream(f"{symbol.lower()}@trade"):
+            yield _parse_ws_trade(data)
+
+    async def _select_fastest_rest(self) -> None:
+        """Point the REST client at the lowest-latency mirror, once.
+
+        Runs lazily before the first bulk download.  The client is shared by
+        every connector with the same configuration, so they all follow.
+        """
+        if self._rest_selected:
+            return
+        self._rest_selected = True
+        fastest = await fastest_base_url(
+            self._client, self._REST_MIRRORS, self._PING_PATH
+        )
+        if fastest is not None:
+            self._client.base_url = fastest
+
+    def last_message(self, symbol: str) -> tuple[int, int | None] | None:
+        """``(monotonic_ns, skew_ms)`` of *symbol*'s freshest WebSocket event.
+
+        ``None`` until the first event for *symbol* arrives.
+        """
+        return self._streams.last_seen(f"{symbol.lower()}@")
+
+    @property
+    def reconnects(self) -> int:
+        """Transparent reconnects of the shared WebSocket connection."""
+        return self._streams.reconnects
+
+    @property
+    def dropped_events(self) -> int:
+        """WebSocket events dropped because a stream consumer fell behind."""
+        return self._streams.dropped
 
     # ----------------------------------------------------------------- lifecycle
 
+    async def warmup(self) -> None:
+        """Open the REST connection now rather than on the first request.
+
+        Selects the fastest mirror (if enabled) and pings it, so the TCP,
+        TLS and HTTP/2 setup is paid here instead of by the first download.
+        A failed ping is ignored; the first real request will retry.
+        """
+        await self._select_fastest_rest()
+        with contextlib.suppress(httpx.HTTPError):
+            await self._client.get(self._PING_PATH)
+
     async def aclose(self) -> None:
-        await self._client.aclose()
+        if self._closed:
+            return
+        self._closed = True
+        await self._streams.aclose()
+        await release_http_client(self._client)
 
     async def __aenter__(self) -> BinanceFuturesConnector:
+        await self.warmup()
         return self
 
     async def __aexit__(self, *_: object) -> None:
@@ -311,14 +486,12 @@ def _parse_rest_trade(row: dict[str, Any]) -> RawTrade:
 
 
 def _parse_ws_trade(data: dict[str, Any]) -> RawTrade:
-    from decimal import Decimal
-
-    quote_qty = str(Decimal(data["p"]) * Decimal(data["q"]))
+    # WS trade stream omits quoteQty; left unset instead of computing it per tick
     return RawTrade(
         id=data["t"],
         price=data["p"],
         qty=data["q"],
-        quote_qty=quote_qty,
+        quote_qty=None,
         time=data["T"],
         is_buyer_maker=data["m"],
     )
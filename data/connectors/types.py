@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import StrEnum
-from typing import TypedDict
 
 
 class KlineInterval(StrEnum):
@@ -21,8 +21,40 @@ class KlineInterval(StrEnum):
     W1 = "1w"
     MO1 = "1M"
 
-
-class RawKline(TypedDict):
+    @property
+    def ms(self) -> int:
+        """Nominal duration of the interval in milliseconds."""
+        return _INTERVAL_MS[self]
+
+    @property
+    def seconds(self) -> int:
+        """Nominal duration of the interval in seconds."""
+        return _INTERVAL_MS[self] // 1_000
+
+
+# Nominal duration of each interval in milliseconds.
+# MO1 uses 30 days as an approximation.
+_INTERVAL_MS: dict[KlineInterval, int] = {
+    KlineInterval.M1: 60_000,
+    KlineInterval.M3: 180_000,
+    KlineInterval.M5: 300_000,
+    KlineInterval.M15: 900_000,
+    KlineInterval.M30: 1_800_000,
+    KlineInterval.H1: 3_600_000,
+    KlineInterval.H2: 7_200_000,
+    KlineInterval.H4: 14_400_000,
+    KlineInterval.H6: 21_600_000,
+    KlineInterval.H8: 28_800_000,
+    KlineInterval.H12: 43_200_000,
+    KlineInterval.D1: 86_400_000,
+    KlineInterval.D3: 259_200_000,
+    KlineInterval.W1: 604_800_000,
+    KlineInterval.MO1: 2_592_000_000,
+}
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RawKline:
     """Raw kline as returned by the Binance REST and WebSocket APIs.
 
     Prices and volumes are kept as strings to preserve the exact precision
@@ -42,18 +74,25 @@ class RawKline(TypedDict):
     taker_buy_quote_volume: str
 
 
-class RawTrade(TypedDict):
-    """Raw trade as returned by the Binance REST and WebSocket APIs."""
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RawTrade:
+    """Raw trade as returned by the Binance REST and WebSocket APIs.
+
+    ``quote_qty`` is only sent by the REST API; WebSocket trades leave it
+    ``None`` rather than paying a ``Decimal`` multiply per tick — derive it
+    from ``price`` × ``qty`` where it is actually needed.
+    """
 
     id: int
     price: str
     qty: str
-    quote_qty: str
+    quote_qty: str | None
     time: int  # millisecond timestamp
     is_buyer_maker: bool
 
 
-class RawFundingRate(TypedDict):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RawFundingRate:
     """Raw funding rate record from the Binance Futures REST API
     (``/fapi/v1/fundingRate``).
 
@@ -66,7 +105,8 @@ class RawFundingRate(TypedDict):
     mark_price: str  # mark price at settlement
 
 
-class RawMarkPrice(TypedDict):
+@dataclass(frozen=True, kw_only=True, slots=True)
+class RawMarkPrice:
     """Raw mark-price snapshot from ``/fapi/v1/premiumIndex``.
 
     Represents the *current* (unsettled) funding rate together with the
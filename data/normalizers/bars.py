@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
+    import numpy.typing as npt
+
+from datetime import UTC, datetime
 from decimal import Decimal
 
-from data.types import DollarBar, TickBar, Trade, VolumeBar
+import numpy as np
+
+from data.types import Bar, DollarBar, TickBar, Trade, TradeBatch, VolumeBar
+
+_B = TypeVar("_B", bound=Bar)
+# headroom below int64 max for the scaled running volume; the factor of two
+# absorbs the float rounding in the overflow estimate
+_INT64_SAFE = 2**62
+_N = TypeVar("_N", bound=np.generic)
 
 
 def build_volume_bars(
@@ -20,20 +32,14 @@ def build_volume_bars(
     current bar reaches *threshold*.  Any remaining (unconsumed) trades at
     the end of the iterable are discarded — callers that need partial bars
     should handle that at a higher level.
-    """
-    bars: list[VolumeBar] = []
-    bucket: list[Trade] = []
-    cum_volume = Decimal(0)
 
-    for trade in trades:
-        bucket.append(trade)
-        cum_volume += trade.quantity
-        if cum_volume >= threshold:
-            bars.append(_make_volume_bar(bucket, threshold))
-            bucket = []
-            cum_volume = Decimal(0)
-
-    return bars
+    A :class:`~data.types.TradeBatch` is aggregated in vectorized passes
+    instead, with bar boundaries found on an exact ``int64`` running volume;
+    only the resulting bars are materialized as objects.
+    """
+    if isinstance(trades, TradeBatch):
+        return _build_volume_bars_batch(trades, threshold)
+    return list(iter_volume_bars(trades, threshold))
 
 
 def build_tick_bars(
@@ -41,16 +47,9 @@ def build_tick_bars(
     threshold: int,
 ) -> list[TickBar]:
     """Aggregate *trades* into tick bars (one bar per *threshold* trades)."""
-    bars: list[TickBar] = []
-    bucket: list[Trade] = []
-
-    for trade in trades:
-        bucket.append(trade)
-        if len(bucket) >= threshold:
-            bars.append(_make_tick_bar(bucket, threshold))
-            bucket = []
-
-    return bars
+    if isinstance(trades, TradeBatch):
+        return _build_tick_bars_batch(trades, threshold)
+    return list(iter_tick_bars(trades, threshold))
 
 
 def build_dollar_bars(
@@ -62,64 +61,322 @@ def build_dollar_bars(
     A new bar starts whenever the cumulative quote-asset value (price × qty)
     of the current bar reaches *threshold*.
     """
-    bars: list[DollarBar] = []
-    bucket: list[Trade] = []
-    cum_dollar = Decimal(0)
+    if isinstance(trades, TradeBatch):
+        return _build_dollar_bars_batch(trades, threshold)
+    return list(iter_dollar_bars(trades, threshold))
+
+
+# ---------------------------------------------------------------- streaming
+
+
+def iter_volume_bars(
+    trades: Iterable[Trade],
+    threshold: Decimal,
+) -> Iterator[VolumeBar]:
+    """Yield volume bars from *trades* as each one closes.
+
+    Streaming form of :func:`build_volume_bars` — nothing but the bar being
+    formed is held in memory, so it can feed a downstream pipeline directly
+    from a live or unbounded trade source.
+    """
+    state: _BarState | None = None
+    threshold_q = math.ceil(threshold.scaleb(Trade.QTY_EXP))
 
     for trade in trades:
-        bucket.append(trade)
-        cum_dollar += trade.price * trade.quantity
-        if cum_dollar >= threshold:
-            bars.append(_make_dollar_bar(bucket, threshold))
-            bucket = []
-            cum_dollar = Decimal(0)
+        if state is None:
+            state = _BarState(trade)
+        else:
+            state.add(trade)
+        if state.volume_q >= threshold_q:
+            yield state.to_bar(VolumeBar, volume_threshold=threshold)
+            state = None
 
-    return bars
 
+def iter_tick_bars(
+    trades: Iterable[Trade],
+    threshold: int,
+) -> Iterator[TickBar]:
+    """Yield tick bars from *trades* as each one closes."""
+    state: _BarState | None = None
 
-# ------------------------------------------------------------------ helpers
+    for trade in trades:
+        if state is None:
+            state = _BarState(trade)
+        else:
+            state.add(trade)
+        if state.trade_count >= threshold:
+            yield state.to_bar(TickBar, tick_threshold=threshold)
+            state = None
+
+
+def iter_dollar_bars(
+    trades: Iterable[Trade],
+    threshold: Decimal,
+) -> Iterator[DollarBar]:
+    """Yield dollar bars from *trades* as each one closes."""
+    state: _BarState | None = None
+    # price_q * quantity_q carries both scales
+    threshold_q = math.ceil(threshold.scaleb(Trade.PRICE_EXP + Trade.QTY_EXP))
+    cum_dollar_q = 0
+
+    for trade in trades:
+        if state is None:
+            state = _BarState(trade)
+        else:
+            state.add(trade)
+        cum_dollar_q += trade.price_q * trade.quantity_q
+        if cum_dollar_q >= threshold_q:
+            yield state.to_bar(DollarBar, dollar_threshold=threshold)
+            state = None
+            cum_dollar_q = 0
+
+
+def _build_volume_bars_batch(trades: TradeBatch, threshold: Decimal) -> list[VolumeBar]:
+    # boundaries from an exact int64 running volume in Trade.QTY_EXP units,
+    # so they match the Decimal builder instead of drifting with float sums
+    threshold_q = math.ceil(threshold.scaleb(Trade.QTY_EXP))
+    total_q = float(np.sum(trades.quantity)) * 10.0**Trade.QTY_EXP
+    if total_q + threshold_q >= _INT64_SAFE:
+        # the running volume would wrap int64 (e.g. meme-coin quantities);
+        # the Decimal builder has no such limit
+        return list(iter_volume_bars(trades, threshold))
+    qty_q = np.rint(trades.quantity * 10.0**Trade.QTY_EXP).astype(np.int64)
+    last = _bar_closes(np.cumsum(qty_q, dtype=np.int64), threshold_q)
+    arrays = _bar_arrays(trades.price, trades.quantity, trades.timestamp_ns, last)
+    return _to_bars(VolumeBar, trades.symbol, arrays, volume_threshold=threshold)
 
 
-def _make_volume_bar(trades: list[Trade], threshold: Decimal) -> VolumeBar:
-    return VolumeBar(
-        symbol=trades[0].symbol,
-        open=trades[0].price,
-        high=max(t.price for t in trades),
-        low=min(t.price for t in trades),
-        close=trades[-1].price,
-        volume=sum((t.quantity for t in trades), Decimal(0)),
-        trade_count=len(trades),
-        timestamp=trades[0].timestamp,
-        close_time=trades[-1].timestamp,
-        volume_threshold=threshold,
+def _build_tick_bars_batch(trades: TradeBatch, threshold: int) -> list[TickBar]:
+    arrays = build_tick_bars_np(
+        trades.price, trades.quantity, trades.timestamp_ns, threshold
     )
+    return _to_bars(TickBar, trades.symbol, arrays, tick_threshold=threshold)
+
+
+def _build_dollar_bars_batch(trades: TradeBatch, threshold: Decimal) -> list[DollarBar]:
+    arrays = build_dollar_bars_np(
+        trades.price,
+        trades.quantity,
+        trades.timestamp_ns,
+        float(threshold),
+        notional=trades.notional,
+    )
+    return _to_bars(DollarBar, trades.symbol, arrays, dollar_threshold=threshold)
+
+
+# ------------------------------------------------------------ array fast path
+
 
+class BarArrays(NamedTuple):
+    """Column arrays for a run of bars built by the NumPy fast path.
 
-def _make_tick_bar(trades: list[Trade], threshold: int) -> TickBar:
-    return TickBar(
-        symbol=trades[0].symbol,
-        open=trades[0].price,
-        high=max(t.price for t in trades),
-        low=min(t.price for t in trades),
-        close=trades[-1].price,
-        volume=sum((t.quantity for t in trades), Decimal(0)),
-        trade_count=len(trades),
-        timestamp=trades[0].timestamp,
-        close_time=trades[-1].timestamp,
-        tick_threshold=threshold,
+    Prices and volumes are ``float64`` and times are epoch nanoseconds; use
+    this only where exact exchange precision is not required (research,
+    backtests).
+    """
+
+    open_time_ns: npt.NDArray[np.int64]
+    open: npt.NDArray[np.float64]
+    high: npt.NDArray[np.float64]
+    low: npt.NDArray[np.float64]
+    close: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.float64]
+    close_time_ns: npt.NDArray[np.int64]
+    trade_count: npt.NDArray[np.int64]
+
+
+def build_volume_bars_np(
+    prices: npt.NDArray[np.float64],
+    qtys: npt.NDArray[np.float64],
+    ts_ns: npt.NDArray[np.int64],
+    threshold: float,
+) -> BarArrays:
+    """Array counterpart of :func:`build_volume_bars` for bulk trade data.
+
+    Takes parallel per-trade arrays and follows the same rules: a bar closes
+    on the first trade that brings its volume to *threshold*, the next bar
+    starts from zero, and trailing trades that never reach the threshold
+    are discarded.  Bar boundaries are located by binary search on the
+    cumulative volume — one ``searchsorted`` per bar rather than one Python
+    step per trade — and OHLCV is reduced per bar with ``ufunc.reduceat``.
+    """
+    last = _bar_closes(np.cumsum(qtys, dtype=np.float64), threshold)
+    return _bar_arrays(prices, qtys, ts_ns, last)
+
+
+def build_tick_bars_np(
+    prices: npt.NDArray[np.float64],
+    qtys: npt.NDArray[np.float64],
+    ts_ns: npt.NDArray[np.int64],
+    threshold: int,
+) -> BarArrays:
+    """Array counterpart of :func:`build_tick_bars` for bulk trade data."""
+    last = np.arange(threshold - 1, len(prices), threshold, dtype=np.intp)
+    return _bar_arrays(prices, qtys, ts_ns, last)
+
+
+def build_dollar_bars_np(
+    prices: npt.NDArray[np.float64],
+    qtys: npt.NDArray[np.float64],
+    ts_ns: npt.NDArray[np.int64],
+    threshold: float,
+    *,
+    notional: npt.NDArray[np.float64] | None = None,
+) -> BarArrays:
+    """Array counterpart of :func:`build_dollar_bars` for bulk trade data.
+
+    Boundaries come from the cumulative notional (price × qty); the bar
+    volume is still reported in the base asset.  Pass a precomputed
+    *notional* array to skip the per-call multiplication.
+    """
+    if notional is None:
+        notional = prices * qtys
+    last = _bar_closes(np.cumsum(notional, dtype=np.float64), threshold)
+    return _bar_arrays(prices, qtys, ts_ns, last)
+
+
+def _bar_arrays(
+    prices: npt.NDArray[np.float64],
+    qtys: npt.NDArray[np.float64],
+    ts_ns: npt.NDArray[np.int64],
+    last: npt.NDArray[np.intp],
+) -> BarArrays:
+    """Reduce the trades up to each index in *last* into one bar apiece."""
+    first = _bar_opens(last)
+    stop = int(last[-1]) + 1 if len(last) else 0  # unfinished tail is dropped
+    return BarArrays(
+        open_time_ns=ts_ns[first].astype(np.int64),
+        open=prices[first],
+        high=_reduce(np.maximum, prices[:stop], first),
+        low=_reduce(np.minimum, prices[:stop], first),
+        close=prices[last],
+        volume=_reduce(np.add, qtys[:stop], first),
+        close_time_ns=ts_ns[last].astype(np.int64),
+        trade_count=(last - first + 1).astype(np.int64),
     )
 
 
-def _make_dollar_bar(trades: list[Trade], threshold: Decimal) -> DollarBar:
-    return DollarBar(
-        symbol=trades[0].symbol,
-        open=trades[0].price,
-        high=max(t.price for t in trades),
-        low=min(t.price for t in trades),
-        close=trades[-1].price,
-        volume=sum((t.quantity for t in trades), Decimal(0)),
-        trade_count=len(trades),
-        timestamp=trades[0].timestamp,
-        close_time=trades[-1].timestamp,
-        dollar_threshold=threshold,
+def _bar_closes(cum: npt.NDArray[Any], threshold: float) -> npt.NDArray[np.intp]:
+    """Index of the closing trade of every complete volume bar.
+
+    Each bar restarts from zero, so the next close is the first index whose
+    cumulative volume reaches the previous close's plus *threshold*.
+    """
+    n = len(cum)
+    ends: list[int] = []
+    filled = cum.dtype.type(0)  # cumulative volume at the previous close
+    while True:
+        end = int(np.searchsorted(cum, filled + threshold))
+        if end >= n:
+            break
+        ends.append(end)
+        filled = cum[end]
+    return np.asarray(ends, dtype=np.intp)
+
+
+def _bar_opens(last: npt.NDArray[np.intp]) -> npt.NDArray[np.intp]:
+    first = np.empty_like(last)
+    if len(last):
+        first[0] = 0
+        first[1:] = last[:-1] + 1
+    return first
+
+
+def _reduce(
+    ufunc: np.ufunc, values: npt.NDArray[_N], first: npt.NDArray[np.intp]
+) -> npt.NDArray[_N]:
+    if not len(first):
+        return values[:0]
+    result: npt.NDArray[_N] = ufunc.reduceat(values, first)
+    return result
+
+
+# ------------------------------------------------------------------ helpers
+
+
+def _to_bars(
+    bar_cls: type[_B], symbol: str, arrays: BarArrays, **threshold: Any
+) -> list[_B]:
+    """Materialize :class:`BarArrays` rows as *bar_cls* instances."""
+    return [
+        bar_cls(
+            symbol=symbol,
+            open=Decimal(repr(open_)),
+            high=Decimal(repr(high)),
+            low=Decimal(repr(low)),
+            close=Decimal(repr(close)),
+            volume=Decimal(repr(volume)),
+            trade_count=trade_count,
+            timestamp=_ns_to_utc(open_ns),
+            close_time=_ns_to_utc(close_ns),
+            **threshold,
+        )
+        for open_ns, open_, high, low, close, volume, close_ns, trade_count in zip(
+            *(column.tolist() for column in arrays), strict=True
+        )
+    ]
+
+
+def _ns_to_utc(ns: int) -> datetime:
+    return datetime.fromtimestamp(ns // 1_000 / 1_000_000, tz=UTC)
+
+
+class _BarState:
+    """Running OHLCV aggregates of the bar currently being formed.
+
+    Trades are folded in as they arrive, so no per-bar list of trades is
+    kept and the bar is emitted without a second pass.  The emitted volume
+    is the exact ``Decimal`` sum; :attr:`volume_q` tracks it in
+    :attr:`~data.types.Trade.quantity_q` units so threshold checks are
+    ``int`` comparisons.
+    """
+
+    __slots__ = (
+        "close",
+        "close_time",
+        "high",
+        "low",
+        "open",
+        "open_time",
+        "symbol",
+        "trade_count",
+        "volume",
+        "volume_q",
     )
+
+    def __init__(self, trade: Trade) -> None:
+        price = trade.price
+        self.symbol = trade.symbol
+        self.open = self.high = self.low = self.close = price
+        self.volume = trade.quantity
+        self.volume_q = trade.quantity_q  # for threshold checks, see Trade
+        self.trade_count = 1
+        self.open_time: datetime = trade.timestamp
+        self.close_time: datetime = trade.timestamp
+
+    def add(self, trade: Trade) -> None:
+        price = trade.price
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += trade.quantity
+        self.volume_q += trade.quantity_q
+        self.trade_count += 1
+        self.close_time = trade.timestamp
+
+    def to_bar(self, bar_cls: type[_B], **threshold: Any) -> _B:
+        """Build a *bar_cls*; *threshold* carries its bar-specific field."""
+        return bar_cls(
+            symbol=self.symbol,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            trade_count=self.trade_count,
+            timestamp=self.open_time,
+            close_time=self.close_time,
+            **threshold,
+        )
@@ -1,30 +1,21 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from decimal import Decimal
-
-from data.connectors.types import KlineInterval, RawKline, RawTrade
-from data.types import TimeBar, Trade
-
-# Nominal duration for each Binance kline interval.
-# MO1 uses 30 days as an approximation.
-_INTERVAL_SECONDS: dict[KlineInterval, int] = {
-    KlineInterval.M1: 60,
-    KlineInterval.M3: 180,
-    KlineInterval.M5: 300,
-    KlineInterval.M15: 900,
-    KlineInterval.M30: 1_800,
-    KlineInterval.H1: 3_600,
-    KlineInterval.H2: 7_200,
-    KlineInterval.H4: 14_400,
-    KlineInterval.H6: 21_600,
-    KlineInterval.H8: 28_800,
-    KlineInterval.H12: 43_200,
-    KlineInterval.D1: 86_400,
-    KlineInterval.D3: 259_200,
-    KlineInterval.W1: 604_800,
-    KlineInterval.MO1: 2_592_000,
-}
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from data.normalizers.common import parse_decimal
+from data.types import TimeBar, Trade, TradeBatch
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from data.connectors.types import KlineInterval, RawKline, RawTrade
+
+_KLINE_ROW_WIDTH = 12  # fields per Binance REST kline row
 
 
 def to_time_bar(raw: RawKline, *, symbol: str, interval: KlineInterval) -> TimeBar:
@@ -35,15 +26,87 @@ def to_time_bar(raw: RawKline, *, symbol: str, interval: KlineInterval) -> TimeB
     """
     return TimeBar(
         symbol=symbol,
-        open=Decimal(raw["open"]),
-        high=Decimal(raw["high"]),
-        low=Decimal(raw["low"]),
-        close=Decimal(raw["close"]),
-        volume=Decimal(raw["volume"]),
-        trade_count=raw["trade_count"],
-        timestamp=_ms_to_utc(raw["open_time_ms"]),
-        close_time=_ms_to_utc(raw["close_time_ms"]),
-        interval_seconds=_INTERVAL_SECONDS[interval],
+        open=parse_decimal(raw.open),
+        high=parse_decimal(raw.high),
+        low=parse_decimal(raw.low),
+        close=parse_decimal(raw.close),
+        volume=parse_decimal(raw.volume),
+        trade_count=raw.trade_count,
+        timestamp=_ms_to_utc(raw.open_time_ms),
+        close_time=_ms_to_utc(raw.close_time_ms),
+        interval_seconds=interval.seconds,
+    )
+
+
+def to_time_bar_from_row(
+    row: list[Any], *, symbol: str, interval: KlineInterval
+) -> TimeBar:
+    """Convert a raw Binance REST kline row straight into a
+    :class:`~data.types.TimeBar`, skipping the intermediate
+    :class:`~data.connectors.types.RawKline`.
+
+    Spot and USD-M futures share the same row layout
+    (``[open_time, open, high, low, close, volume, close_time, ...]``), so
+    this serves both markets.
+    """
+    return TimeBar(
+        symbol=symbol,
+        open=parse_decimal(row[1]),
+        high=parse_decimal(row[2]),
+        low=parse_decimal(row[3]),
+        close=parse_decimal(row[4]),
+        volume=parse_decimal(row[5]),
+        trade_count=int(row[8]),
+        timestamp=_ms_to_utc(int(row[0])),
+        close_time=_ms_to_utc(int(row[6])),
+        interval_seconds=interval.seconds,
+    )
+
+
+class KlineArrays(NamedTuple):
+    """Column arrays for a run of klines — the float64 fast path.
+
+    Prices and volumes are ``float64`` rather than ``Decimal``; use this only
+    where exact exchange precision is not required (research, backtests).
+    """
+
+    open_time_ms: npt.NDArray[np.int64]
+    open: npt.NDArray[np.float64]
+    high: npt.NDArray[np.float64]
+    low: npt.NDArray[np.float64]
+    close: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.float64]
+    close_time_ms: npt.NDArray[np.int64]
+    trade_count: npt.NDArray[np.int64]
+
+    @property
+    def open_time(self) -> npt.NDArray[np.datetime64]:
+        """``open_time_ms`` as ``datetime64[ns]`` (UTC)."""
+        return _ms_to_utc_batch(self.open_time_ms)
+
+    @property
+    def close_time(self) -> npt.NDArray[np.datetime64]:
+        """``close_time_ms`` as ``datetime64[ns]`` (UTC)."""
+        return _ms_to_utc_batch(self.close_time_ms)
+
+
+def to_kline_arrays(rows: Sequence[list[Any]]) -> KlineArrays:
+    """Convert raw Binance REST kline rows into :class:`KlineArrays`.
+
+    Each column is converted in a single vectorized pass instead of five
+    ``Decimal`` parses per row.  Spot and futures rows share the layout.
+    """
+    table = np.asarray(rows, dtype=object).reshape(-1, _KLINE_ROW_WIDTH)
+    ohlcv = table[:, 1:6].astype(np.float64)
+    return KlineArrays(
+        open_time_ms=table[:, 0].astype(np.int64),
+        open=ohlcv[:, 0],
+        high=ohlcv[:, 1],
+        low=ohlcv[:, 2],
+        close=ohlcv[:, 3],
+        volume=ohlcv[:, 4],
+        close_time_ms=table[:, 6].astype(np.int64),
+        trade_count=table[:, 8].astype(np.int64),
     )
 
 
@@ -51,12 +114,36 @@ def to_trade(raw: RawTrade, *, symbol: str) -> Trade:
     """Convert a raw Binance trade into a canonical :class:`~data.types.Trade`."""
     return Trade(
         symbol=symbol,
-        price=Decimal(raw["price"]),
-        quantity=Decimal(raw["qty"]),
-        timestamp=_ms_to_utc(raw["time"]),
-        is_buyer_maker=raw["is_buyer_maker"],
+        price=parse_decimal(raw.price),
+        quantity=parse_decimal(raw.qty),
+        timestamp=_ms_to_utc(raw.time),
+        is_buyer_maker=raw.is_buyer_maker,
+    )
+
+
+def to_trade_batch(raws: Sequence[RawTrade], *, symbol: str) -> TradeBatch:
+    """Convert raw Binance trades into a :class:`~data.types.TradeBatch`.
+
+    The bulk counterpart of :func:`to_trade`: columns are parsed in
+    vectorized passes and timestamps stay as epoch nanoseconds — no
+    ``Decimal`` or ``datetime`` is created per trade.
+    """
+    times = np.fromiter((raw.time for raw in raws), dtype=np.int64, count=len(raws))
+    return TradeBatch(
+        symbol=symbol,
+        price=np.array([raw.price for raw in raws]).astype(np.float64),
+        quantity=np.array([raw.qty for raw in raws]).astype(np.float64),
+        timestamp_ns=_ms_to_utc_batch(times).view(np.int64),
+        is_buyer_maker=np.fromiter(
+            (raw.is_buyer_maker for raw in raws), dtype=bool, count=len(raws)
+        ),
     )
 
 
 def _ms_to_utc(ms: int) -> datetime:
     return datetime.fromtimestamp(ms / 1_000, tz=UTC)
+
+
+def _ms_to_utc_batch(ms: npt.NDArray[np.int64]) -> npt.NDArray[np.datetime64]:
+    """Vectorized :func:`_ms_to_utc`: epoch ms → ``datetime64[ns]`` (UTC)."""
+    return ms.astype("datetime64[ms]").astype("datetime64[ns]")
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from data.connectors.types import (
         KlineInterval,
         RawFundingRate,
@@ -12,6 +13,7 @@ if TYPE_CHECKING:
     )
 
 from data.normalizers.binance import _ms_to_utc, to_time_bar
+from data.normalizers.common import parse_decimal
 from data.types import FundingRate, TimeBar
 
 
@@ -31,10 +33,48 @@ def to_funding_rate(raw: RawFundingRate) -> FundingRate:
     :class:`~data.types.FundingRate`.
     """
     return FundingRate(
-        symbol=raw["symbol"],
-        funding_rate=Decimal(raw["funding_rate"]),
-        mark_price=Decimal(raw["mark_price"]),
-        timestamp=_ms_to_utc(raw["funding_time_ms"]),
+        symbol=raw.symbol,
+        funding_rate=parse_decimal(raw.funding_rate),
+        mark_price=parse_decimal(raw.mark_price),
+        timestamp=_ms_to_utc(raw.funding_time_ms),
+    )
+
+
+def to_funding_rate_from_row(row: dict[str, Any]) -> FundingRate:
+    """Convert a raw ``/fapi/v1/fundingRate`` REST record straight into a
+    :class:`~data.types.FundingRate`, skipping the intermediate
+    :class:`~data.connectors.types.RawFundingRate`.
+    """
+    return FundingRate(
+        symbol=row["symbol"],
+        funding_rate=parse_decimal(row["fundingRate"]),
+        mark_price=parse_decimal(row.get("markPrice", "0")),
+        timestamp=_ms_to_utc(int(row["fundingTime"])),
+    )
+
+
+def to_funding_rates_batch(raws: Sequence[RawFundingRate]) -> list[FundingRate]:
+    """Bulk counterpart of :func:`to_funding_rate` for backfills.
+
+    Each field is converted column-wise with ``map`` so the per-record loop
+    runs inside CPython's C iterators rather than a Python-level call per
+    record.
+    """
+    return _funding_rates(
+        [raw.symbol for raw in raws],
+        [raw.funding_rate for raw in raws],
+        [raw.mark_price for raw in raws],
+        [raw.funding_time_ms for raw in raws],
+    )
+
+
+def to_funding_rates_from_rows(rows: Sequence[dict[str, Any]]) -> list[FundingRate]:
+    """Bulk counterpart of :func:`to_funding_rate_from_row` for REST pages."""
+    return _funding_rates(
+        [row["symbol"] for row in rows],
+        [row["fundingRate"] for row in rows],
+        [row.get("markPrice", "0") for row in rows],
+        [int(row["fundingTime"]) for row in rows],
     )
 
 
@@ -46,9 +86,32 @@ def to_current_funding_rate(raw: RawMarkPrice) -> FundingRate:
     ``next_funding_time_ms`` field, which is only present on live snapshots.
     """
     return FundingRate(
-        symbol=raw["symbol"],
-        funding_rate=Decimal(raw["last_funding_rate"]),
-        mark_price=Decimal(raw["mark_price"]),
-        timestamp=_ms_to_utc(raw["time_ms"]),
-        next_funding_time=_ms_to_utc(raw["next_funding_time_ms"]),
+        symbol=raw.symbol,
+        funding_rate=parse_decimal(raw.last_funding_rate),
+        mark_price=parse_decimal(raw.mark_price),
+        timestamp=_ms_to_utc(raw.time_ms),
+        next_funding_time=_ms_to_utc(raw.next_funding_time_ms),
     )
+
+
+def _funding_rates(
+    symbols: list[str],
+    rates: list[str],
+    marks: list[str],
+    times_ms: list[int],
+) -> list[FundingRate]:
+    return [
+        FundingRate(
+            symbol=symbol,
+            funding_rate=rate,
+            mark_price=mark,
+            timestamp=timestamp,
+        )
+        for symbol, rate, mark, timestamp in zip(
+            symbols,
+            map(parse_decimal, rates),
+            map(parse_decimal, marks),
+            map(_ms_to_utc, times_ms),
+            strict=True,
+        )
+    ]
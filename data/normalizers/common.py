@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from functools import lru_cache
+
+
+@lru_cache(maxsize=65_536)
+def parse_decimal(value: str) -> Decimal:
+    """``Decimal(value)``, memoized on the exchange string.
+
+    Price and size strings repeat heavily (quiet bars, round lots), and
+    ``Decimal`` is immutable, so a hit can safely share the parsed instance.
+    """
+    return Decimal(value)
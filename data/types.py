@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from datetime import datetime
-    from decimal import Decimal
+    from collections.abc import Iterator, Sequence
+
+    import numpy.typing as npt
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from enum import StrEnum
+from functools import cached_property
 from typing import ClassVar
 
+import numpy as np
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_US = timedelta(microseconds=1)
+
 
 class BarType(StrEnum):
     TIME = "time"
@@ -17,18 +26,98 @@ class BarType(StrEnum):
     DOLLAR = "dollar"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Trade:
-    """Single executed trade — raw input for bar formation."""
+    """Single executed trade — raw input for bar formation.
+
+    ``price_q`` / ``quantity_q`` are the price and quantity as integers in
+    units of ``10**-PRICE_EXP`` / ``10**-QTY_EXP``, derived once at
+    construction so that bar builders can test their thresholds with
+    ``int`` arithmetic.  Digits beyond that precision are truncated — far
+    finer than any Binance tick or lot size — so these fields only decide
+    *when* a bar closes; reported bar values use the exact ``Decimal``\s.
+    """
+
+    PRICE_EXP: ClassVar[int] = 8
+    QTY_EXP: ClassVar[int] = 8
 
     symbol: str
     price: Decimal
     quantity: Decimal
     timestamp: datetime
     is_buyer_maker: bool  # True → buyer is the maker (taker sold)
+    price_q: int = field(init=False, repr=False, compare=False)
+    quantity_q: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "price_q", int(self.price.scaleb(self.PRICE_EXP)))
+        object.__setattr__(self, "quantity_q", int(self.quantity.scaleb(self.QTY_EXP)))
+
+
+@dataclass(frozen=True, kw_only=True, eq=False)
+class TradeBatch:
+    """A run of trades for one symbol stored as parallel NumPy columns.
+
+    The struct-of-arrays counterpart of ``Sequence[Trade]``: prices and
+    quantities are contiguous ``float64`` arrays, so bulk consumers such as
+    the bar builders can work in vectorized passes instead of touching one
+    :class:`Trade` object and two ``Decimal`` instances per row.  Like the
+    other array fast paths it trades exact precision for speed.
+
+    Iterating a batch yields :class:`Trade` objects for code that still
+    expects them.
+    """
+
+    symbol: str
+    price: npt.NDArray[np.float64]
+    quantity: npt.NDArray[np.float64]
+    timestamp_ns: npt.NDArray[np.int64]  # epoch nanoseconds (UTC)
+    is_buyer_maker: npt.NDArray[np.bool_]
+
+    @classmethod
+    def from_trades(cls, trades: Sequence[Trade]) -> TradeBatch:
+        """Pack *trades* (all of one symbol) into a batch."""
+        return cls(
+            symbol=trades[0].symbol if trades else "",
+            price=np.array([float(t.price) for t in trades], dtype=np.float64),
+            quantity=np.array([float(t.quantity) for t in trades], dtype=np.float64),
+            timestamp_ns=np.array(
+                [(t.timestamp - _EPOCH) // _US * 1_000 for t in trades], dtype=np.int64
+            ),
+            is_buyer_maker=np.array([t.is_buyer_maker for t in trades], dtype=bool),
+        )
+
+    @cached_property
+    def notional(self) -> npt.NDArray[np.float64]:
+        """Per-trade quote value (price × quantity), computed once per batch.
+
+        Cached so that repeated dollar-bar builds over the same batch — e.g.
+        a threshold sweep — pay for the multiplication only once.
+        """
+        return self.price * self.quantity
+
+    def __len__(self) -> int:
+        return len(self.price)
 
+    def __iter__(self) -> Iterator[Trade]:
+        symbol = self.symbol
+        for price, quantity, ts_ns, is_buyer_maker in zip(
+            self.price.tolist(),
+            self.quantity.tolist(),
+            self.timestamp_ns.tolist(),
+            self.is_buyer_maker.tolist(),
+            strict=True,
+        ):
+            yield Trade(
+                symbol=symbol,
+                price=Decimal(repr(price)),
+                quantity=Decimal(repr(quantity)),
+                timestamp=_EPOCH + timedelta(microseconds=ts_ns // 1_000),
+                is_buyer_maker=is_buyer_maker,
+            )
 
-@dataclass(frozen=True, kw_only=True)
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Bar:
     """Base OHLCV bar.  Do not instantiate directly; use a concrete subclass."""
 
@@ -43,7 +132,7 @@ class Bar:
     close_time: datetime  # bar close time (UTC)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TimeBar(Bar):
     """Fixed-duration OHLCV bar (e.g. 60 s, 3 600 s).
 
@@ -55,7 +144,7 @@ class TimeBar(Bar):
     interval_seconds: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TickBar(Bar):
     """OHLCV bar that closes after exactly ``tick_threshold`` trades."""
 
@@ -63,7 +152,7 @@ class TickBar(Bar):
     tick_threshold: int
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class VolumeBar(Bar):
     """OHLCV bar that closes when cumulative base-asset volume crosses
     ``volume_threshold``."""
@@ -72,7 +161,7 @@ class VolumeBar(Bar):
     volume_threshold: Decimal
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DollarBar(Bar):
     """OHLCV bar that closes when cumulative dollar (quote-asset) volume
     crosses ``dollar_threshold``."""
@@ -84,7 +173,58 @@ class DollarBar(Bar):
 AnyBar = TimeBar | TickBar | VolumeBar | DollarBar
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, eq=False)
+class BarBatch:
+    """A run of consecutive bars for one symbol plus parallel NumPy columns.
+
+    The struct-of-arrays view lets a strategy compute signals over a whole
+    chunk — ``np.diff(batch.close)``, rolling means — in vectorized passes;
+    see :meth:`~interfaces.strategy.BaseStrategy.on_bars`.  Prices and
+    volumes are ``float64`` and times epoch nanoseconds, so like
+    :class:`TradeBatch` it trades exact precision for speed.
+
+    Iterating a batch yields the original bar objects.
+    """
+
+    symbol: str
+    bars: tuple[AnyBar, ...]
+    open_time_ns: npt.NDArray[np.int64]  # epoch nanoseconds (UTC)
+    open: npt.NDArray[np.float64]
+    high: npt.NDArray[np.float64]
+    low: npt.NDArray[np.float64]
+    close: npt.NDArray[np.float64]
+    volume: npt.NDArray[np.float64]
+    close_time_ns: npt.NDArray[np.int64]
+    trade_count: npt.NDArray[np.int64]
+
+    @classmethod
+    def from_bars(cls, bars: Sequence[AnyBar]) -> BarBatch:
+        """Pack *bars* (all of one symbol, oldest first) into a batch."""
+        return cls(
+            symbol=bars[0].symbol if bars else "",
+            bars=tuple(bars),
+            open_time_ns=np.array(
+                [(b.timestamp - _EPOCH) // _US * 1_000 for b in bars], dtype=np.int64
+            ),
+            open=np.array([float(b.open) for b in bars], dtype=np.float64),
+            high=np.array([float(b.high) for b in bars], dtype=np.float64),
+            low=np.array([float(b.low) for b in bars], dtype=np.float64),
+            close=np.array([float(b.close) for b in bars], dtype=np.float64),
+            volume=np.array([float(b.volume) for b in bars], dtype=np.float64),
+            close_time_ns=np.array(
+                [(b.close_time - _EPOCH) // _US * 1_000 for b in bars], dtype=np.int64
+            ),
+            trade_count=np.array([b.trade_count for b in bars], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.bars)
+
+    def __iter__(self) -> Iterator[AnyBar]:
+        return iter(self.bars)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FundingRate:
     """A single funding-rate observation from a perpetual futures market.
 
@@ -98,3 +238,22 @@ class FundingRate:
     mark_price: Decimal
     timestamp: datetime
     next_funding_time: datetime | None = None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FeedHealth:
+    """Freshness of one symbol's live WebSocket feed.
+
+    ``lag_ms`` is the time since the last event for the symbol arrived
+    (``math.inf`` before the first one).  ``skew_ms`` is the local clock
+    minus the exchange's event time of that event — network delay plus
+    clock offset — or ``None`` when unknown.  ``reconnects`` counts
+    transparent reconnects of the underlying connection; events sent while
+    it was down are lost.
+    """
+
+    symbol: str
+    last_msg_ns: int | None  # time.monotonic_ns() when the last event arrived
+    lag_ms: float
+    skew_ms: int | None
+    reconnects: int
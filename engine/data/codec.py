@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import dataclasses
-import json
 import types
 import typing
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import TYPE_CHECKING, cast
 
+import orjson
+
 from data.types import DollarBar, FundingRate, TickBar, TimeBar, Trade, VolumeBar
 from execution.types import FillConfirmation, Order
 from interfaces.signals import TargetPosition
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from engine.types import BusEvent
 
+    _Coerce = Callable[[object], object]
+
 """
 This is just basic Encoding/Decoding for NATS server for proper communication.
 
@@ -33,59 +38,75 @@ _TYPE_MAP: dict[str, type] = {
 # Extra namespace for get_type_hints() — resolves TYPE_CHECKING-guarded imports.
 _HINTS_NS: dict[str, type] = {"datetime": datetime, "Decimal": Decimal}
 
+# Per-type field tables, keyed by class name and filled on first use
+_INIT_FIELDS: dict[str, tuple[str, ...]] = {}
+_COERCERS: dict[str, tuple[tuple[str, _Coerce | None], ...]] = {}
+
 
-def _serialize(val: object) -> object:
+def _default(val: object) -> object:
+    # orjson handles datetime natively (same ISO 8601 text as isoformat())
     if isinstance(val, Decimal):
         return str(val)
-    if isinstance(val, datetime):
-        return val.isoformat()
-    return val
+    raise TypeError(f"Type is not JSON serializable: {type(val).__name__}")
 
 
 def encode(event: BusEvent) -> bytes:
     """Serialize a BusEvent to JSON bytes with a ``"type"`` discriminator."""
     d: dict[str, object] = {"type": type(event).__name__}
-    for field in dataclasses.fields(event):
-        d[field.name] = _serialize(getattr(event, field.name))
-    return json.dumps(d).encode()
-
-
-def _coerce(val: object, hint: type) -> object:
-    """Cast a JSON-decoded value to the target type indicated by *hint*."""
-    args: tuple[type, ...] = ()
-    origin = typing.get_origin(hint)
-    if origin is typing.Union or isinstance(hint, types.UnionType):
-        args = typing.get_args(hint)
-    if args:
-        non_none = [a for a in args if a is not type(None)]
-        if val is None:
+    for name in _init_fields(type(event)):
+        d[name] = getattr(event, name)
+    return orjson.dumps(d, default=_default)
+
+
+def _coercer(hint: object) -> _Coerce | None:
+    """Return the function that casts a JSON value to *hint*, if one is needed."""
+    if typing.get_origin(hint) is typing.Union or isinstance(hint, types.UnionType):
+        non_none = [a for a in typing.get_args(hint) if a is not type(None)]
+        inner = _coercer(non_none[0]) if non_none else None
+        if inner is None:
             return None
-        if non_none:
-            return _coerce(val, non_none[0])
+        return lambda val: None if val is None else inner(val)
     if hint is Decimal:
-        return Decimal(str(val))
+        return lambda val: Decimal(str(val))
     if hint is datetime:
-        return datetime.fromisoformat(str(val))
-    return val
+        return lambda val: datetime.fromisoformat(str(val))
+    return None
+
+
+def _init_fields(cls: type) -> tuple[str, ...]:
+    # derived (init=False) fields are rebuilt on decode, so never sent
+    names = _INIT_FIELDS.get(cls.__name__)
+    if names is None:
+        names = tuple(f.name for f in dataclasses.fields(cls) if f.init)
+        _INIT_FIELDS[cls.__name__] = names
+    return names
+
+
+def _field_coercers(cls: type) -> tuple[tuple[str, _Coerce | None], ...]:
+    """Resolve *cls*'s type hints once instead of on every decoded message."""
+    coercers = _COERCERS.get(cls.__name__)
+    if coercers is None:
+        hints = typing.get_type_hints(cls, localns=_HINTS_NS)
+        coercers = tuple((name, _coercer(hints[name])) for name in _init_fields(cls))
+        _COERCERS[cls.__name__] = coercers
+    return coercers
 
 
 def decode(data: bytes) -> BusEvent:
     """Deserialize JSON bytes back to the appropriate BusEvent dataclass."""
-    d: dict[str, object] = json.loads(data)
-    type_name = str(d["type"])
-    cls = _TYPE_MAP[type_name]
-    hints = typing.get_type_hints(cls, localns=_HINTS_NS)
-    kwargs: dict[str, object] = {
-        field.name: _coerce(d[field.name], hints[field.name])
-        for field in dataclasses.fields(cls)
-        if field.name in d
-    }
+    d: dict[str, object] = orjson.loads(data)
+    cls = _TYPE_MAP[str(d["type"])]
+    kwargs: dict[str, object] = {}
+    for name, coerce in _field_coercers(cls):
+        if name in d:
+            val = d[name]
+            kwargs[name] = val if coerce is None else coerce(val)
     return cast("BusEvent", cls(**kwargs))
 
 
 def encode_target(target: TargetPosition) -> bytes:
     """Serialize a TargetPosition to JSON bytes."""
-    return json.dumps(
+    return orjson.dumps(
         {
             "symbol": target.symbol,
             "quantity": str(target.quantity),
@@ -93,12 +114,12 @@ def encode_target(target: TargetPosition) -> bytes:
             "strategy_id": target.strategy_id,
             "exchange": target.exchange,
         }
-    ).encode()
+    )
 
 
 def decode_target(data: bytes) -> TargetPosition:
     """Deserialize JSON bytes back to a TargetPosition."""
-    d: dict[str, str] = json.loads(data)
+    d: dict[str, str] = orjson.loads(data)
     return TargetPosition(
         symbol=d["symbol"],
         quantity=Decimal(d["quantity"]),
@@ -110,19 +131,19 @@ def decode_target(data: bytes) -> TargetPosition:
 
 def encode_fill(fill: FillConfirmation) -> bytes:
     """Serialize a FillConfirmation to JSON bytes."""
-    return json.dumps(
+    return orjson.dumps(
         {
             "strategy_id": fill.strategy_id,
             "symbol": fill.symbol,
             "quantity": str(fill.quantity),
             "fill_price": str(fill.fill_price),
         }
-    ).encode()
+    )
 
 
 def decode_fill(data: bytes) -> FillConfirmation:
     """Deserialize JSON bytes back to a FillConfirmation."""
-    d: dict[str, str] = json.loads(data)
+    d: dict[str, str] = orjson.loads(data)
     return FillConfirmation(
         strategy_id=d["strategy_id"],
         symbol=d["symbol"],
@@ -133,7 +154,7 @@ def decode_fill(data: bytes) -> FillConfirmation:
 
 def encode_order(order: Order) -> bytes:
     """Serialize an Order to JSON bytes."""
-    return json.dumps(
+    return orjson.dumps(
         {
             "symbol": order.symbol,
             "side": order.side,
@@ -141,7 +162,7 @@ def encode_order(order: Order) -> bytes:
             "quantity": str(order.quantity),
             "price": str(order.price),
         }
-    ).encode()
+    )
 
 
 def encode_pnl_snapshot(
@@ -153,7 +174,7 @@ def encode_pnl_snapshot(
     """Serialize a PnL snapshot to JSON bytes."""
     from datetime import datetime
 
-    return json.dumps(
+    return orjson.dumps(
         {
             "strategy_id": strategy_id,
             "total_realized": str(total_realized),
@@ -161,4 +182,4 @@ def encode_pnl_snapshot(
             "total": str(total),
             "timestamp": datetime.now(tz=UTC).isoformat(),
         }
-    ).encode()
+    )
@@ -109,11 +109,11 @@ class PnLCalc:
 
     @property
     def total_realized(self) -> Decimal:
-        return sum((p.realized_pnl for p in self._positions.values()), Decimal(0))
+        return sum([p.realized_pnl for p in self._positions.values()], Decimal(0))
 
     @property
     def total_unrealized(self) -> Decimal:
-        return sum((p.last_unrealized for p in self._positions.values()), Decimal(0))
+        return sum([p.last_unrealized for p in self._positions.values()], Decimal(0))
 
     @property
     def total(self) -> Decimal:
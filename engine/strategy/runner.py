@@ -1,20 +1,23 @@
 from __future__ import annotations
 
+import inspect
 from dataclasses import replace
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 from data.types import DollarBar, FundingRate, TickBar, TimeBar, Trade, VolumeBar
 from interfaces.signals import TargetPosition
 
 if TYPE_CHECKING:
     import asyncio
+    from collections.abc import Callable
 
+    from data.types import AnyBar
     from engine.strategy.guard import StrategyGuard
     from engine.strategy.pnl_calc import PnLCalc
     from engine.types import BusEvent, BusProtocol
     from execution.types import FillConfirmation
-    from interfaces.strategy import BaseStrategy
+    from interfaces.strategy import AsyncStrategy, StrategyLike
 
 
 class StrategyRunner:
@@ -35,7 +38,7 @@ class StrategyRunner:
     def __init__(
         self,
         strategy_id: str,
-        strategy: BaseStrategy,
+        strategy: StrategyLike | AsyncStrategy,
         bus: BusProtocol,
         topics: list[str],
         target_queue: asyncio.Queue[TargetPosition],
@@ -53,6 +56,34 @@ class StrategyRunner:
         self._last_price: dict[str, Decimal] = {}
         # cumulative position per symbol — used to emit flatten signals on guard trip
         self._cum_position: dict[str, Decimal] = {}
+        # event type -> handler, with the strategy callbacks bound once up front;
+        # event types the strategy leaves at the no-op default get no entry
+        self._handlers: dict[type, Callable[[Any], Any]] = {
+            TimeBar: self._on_bar,
+            TickBar: self._on_bar,
+            VolumeBar: self._on_bar,
+            DollarBar: self._on_bar,
+        }
+        if getattr(strategy, "handles_trades", True):
+            trade_callback = getattr(strategy, "trade_callback", None)
+            self._handlers[Trade] = (
+                trade_callback()
+                if trade_callback is not None
+                else cast("AsyncStrategy", strategy).on_trade
+            )
+        if getattr(strategy, "handles_funding_rates", True):
+            self._handlers[FundingRate] = strategy.on_funding_rate
+        # event types whose callback is a coroutine function — decided once
+        # per hook, so sync callbacks never pay for an awaitable check
+        awaited = {
+            event_type
+            for event_type, handler in self._handlers.items()
+            if handler != self._on_bar and inspect.iscoroutinefunction(handler)
+        }
+        if inspect.iscoroutinefunction(strategy.on_bar):
+            awaited.update((TimeBar, TickBar, VolumeBar, DollarBar))
+        self._awaited = frozenset(awaited)
+        self._fill_awaited = inspect.iscoroutinefunction(strategy.on_fill)
 
     @property
     def pnl_calc(self) -> PnLCalc:
@@ -61,32 +92,34 @@ class StrategyRunner:
     async def run(self) -> None:
         """Subscribe, start the strategy, and process events until cancelled."""
         queue = self._bus.subscribe(*self._topics)
-        self._strategy.on_start()
+        await _call_hook(self._strategy.on_start)
         try:
             while True:
                 event = await queue.get()
                 result = self._dispatch(event)
+                if type(event) in self._awaited:
+                    result = await result
                 await self._emit(result)
         finally:
-            self._strategy.on_stop()
-            self._bus.unsubscribe(queue)
-
-    def _dispatch(self, event: BusEvent) -> TargetPosition | None:
-        match event:
-            case TimeBar() | TickBar() | VolumeBar() | DollarBar():
-                self._last_price[event.symbol] = event.close
-                self._pnlcalc.update_market_price(event.symbol, event.close)
-                return self._strategy.on_bar(event)
-            case Trade():
-                return self._strategy.on_trade(event)
-            case FundingRate():
-                return self._strategy.on_funding_rate(event)
-            case _:
-                return None
+            try:
+                await _call_hook(self._strategy.on_stop)
+            finally:
+                self._bus.unsubscribe(queue)
+
+    def _dispatch(self, event: BusEvent) -> Any:
+        handler = self._handlers.get(type(event))
+        return handler(event) if handler is not None else None
+
+    def _on_bar(self, bar: AnyBar) -> Any:
+        self._last_price[bar.symbol] = bar.close
+        self._pnlcalc.update_market_price(bar.symbol, bar.close)
+        return self._strategy.on_bar(bar)
 
     async def notify_fill(self, fill: FillConfirmation) -> None:
         """Forward a fill confirmation to the strategy and emit any follow-up signal."""
-        result = self._strategy.on_fill(fill)
+        result: Any = self._strategy.on_fill(fill)
+        if self._fill_awaited:
+            result = await result
         await self._emit(result)
 
     async def _emit(self, target: TargetPosition | None) -> None:
@@ -117,3 +150,10 @@ class StrategyRunner:
             self._cum_position.get(stamped.symbol, Decimal(0)) + stamped.quantity
         )
         await self._target_queue.put(stamped)
+
+
+async def _call_hook(hook: Callable[[], object]) -> None:
+    """Call a lifecycle hook, awaiting it if the strategy made it async."""
+    result = hook()
+    if inspect.isawaitable(result):
+        await result
@@ -12,6 +12,11 @@ Optional:
     BYBIT_DEMO=1      — use demo trading endpoint (https://api-demo.bybit.com)
                         omit or set to 0 for live trading
 
+Pass ``trade_ws=True`` to submit single orders over Bybit's WebSocket trade
+API instead of REST.  The signed session is opened on ``async with``; while
+it is down, orders fall back to REST and the next order starts a background
+reconnect, with exponential backoff between failed attempts.
+
 Usage::
 
     broker = BybitBroker()          # reads creds from env
@@ -21,18 +26,24 @@ Usage::
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import hashlib
 import hmac
 import json
+import logging
 import os
 import time
 import uuid
 from decimal import Decimal
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 import httpx
+import orjson
+import websockets
 
 from execution.types import (
+    AccountSnapshot,
     Order,
     OrderResult,
     OrderSide,
@@ -40,12 +51,27 @@ from execution.types import (
     PerpOrder,
     PerpPosition,
 )
-from interfaces.broker import BaseBroker
+from interfaces.broker import BaseBroker, BrokerCapability
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from websockets.asyncio.client import ClientConnection
+
+log = logging.getLogger(__name__)
 
 _LIVE_URL = "https://api.bybit.com"
 _DEMO_URL = "https://api-demo.bybit.com"
+_LIVE_TRADE_WS = "wss://stream.bybit.com/v5/trade"
+_DEMO_TRADE_WS = "wss://stream-demo.bybit.com/v5/trade"
+_WS_ACK_TIMEOUT = 5.0  # seconds to wait for an order.create ack
+_WS_RETRY_MIN_DELAY = 1.0  # first trade-WS reconnect backoff, seconds
+_WS_RETRY_MAX_DELAY = 60.0
 
 _RECV_WINDOW = "5000"
+_MAX_CONNECTIONS = 8  # HTTP/2 multiplexes, so a few sockets go a long way
+_BATCH_LIMIT = 10  # max orders per linear create-batch request
+_SETTLE_COIN = "USDT"  # settlement coin of the linear contracts traded here
 
 
 class BybitBroker(BaseBroker):
@@ -57,12 +83,21 @@ class BybitBroker(BaseBroker):
     Set ``BYBIT_DEMO=1`` to trade on the demo account — same API, virtual funds.
     """
 
+    # no WS_TRADE: the trade socket is opt-in per instance (``trade_ws=True``)
+    capabilities: ClassVar[frozenset[BrokerCapability]] = frozenset(
+        {
+            BrokerCapability.BATCH_PLACE,
+            BrokerCapability.CANCEL_BY_SYMBOL,
+        }
+    )
+
     def __init__(
         self,
         api_key: str | None = None,
         api_secret: str | None = None,
         *,
         demo: bool = bool(os.getenv("BYBIT_DEMO")),
+        trade_ws: bool = False,
     ) -> None:
         self._api_key = api_key or os.environ["BYBIT_API_KEY"]
         self._api_secret = api_secret or os.environ["BYBIT_API_SECRET"]
@@ -71,11 +106,30 @@ class BybitBroker(BaseBroker):
         # querying multiple symbols does not overwrite each other.
         self._realized_pnl_cache: dict[str, Decimal] = {}  # PNL fix!!!
         self._unrealized_pnl_cache: dict[str, Decimal] = {}  # PNL fix!!!
+        # One client for the broker's lifetime: keep-alive plus HTTP/2 lets
+        # concurrent orders multiplex over a single TLS session.
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             timeout=httpx.Timeout(10.0),
             headers={"Content-Type": "application/json"},
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_CONNECTIONS,
+                keepalive_expiry=60.0,
+            ),
         )
+        self._trade_ws_url = (
+            (_DEMO_TRADE_WS if demo else _LIVE_TRADE_WS) if trade_ws else None
+        )
+        self._trade_ws: ClientConnection | None = None
+        self._trade_ws_reader: asyncio.Task[None] | None = None
+        self._trade_ws_connect: asyncio.Task[None] | None = None
+        # reconnect backoff: consecutive failures and the earliest next try
+        self._trade_ws_failures = 0
+        self._trade_ws_retry_at = 0.0
+        # reqId -> ack future, resolved by the reader task
+        self._ws_pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------ auth
 
@@ -98,6 +152,123 @@ class BybitBroker(BaseBroker):
     def _ts() -> str:
         return str(int(time.time() * 1000))
 
+    # ---------------------------------------------------------------- warmup
+
+    async def _warmup(self) -> None:
+        await asyncio.gather(self._ensure_trade_ws(), self._open_http())
+
+    async def _open_http(self) -> None:
+        # public endpoint: opens the pooled TLS connection without signing
+        with contextlib.suppress(httpx.HTTPError):
+            await self._client.get("/v5/market/time")
+
+    # ---------------------------------------------------------------- trade ws
+
+    async def _ensure_trade_ws(self) -> None:
+        """Open the trade WebSocket; on failure, log and stay on REST.
+
+        Failed attempts back off exponentially; :meth:`place_order` retries
+        in the background once the backoff has elapsed.
+        """
+        if self._trade_ws_url is None or self._trade_ws is not None:
+            return
+        try:
+            await self._connect_trade_ws(self._trade_ws_url)
+        except (OSError, ValueError, websockets.WebSocketException) as exc:
+            delay = min(
+                _WS_RETRY_MAX_DELAY, _WS_RETRY_MIN_DELAY * 2**self._trade_ws_failures
+            )
+            self._trade_ws_failures += 1
+            self._trade_ws_retry_at = time.monotonic() + delay
+            log.warning(
+                "Bybit trade WS connect failed (%r) — orders use REST, retry in %.0fs",
+                exc,
+                delay,
+            )
+        else:
+            self._trade_ws_failures = 0
+
+    def _reconnect_trade_ws(self) -> None:
+        """Start a background reconnect if the WS is down and backoff allows."""
+        connecting = self._trade_ws_connect
+        if (
+            self._trade_ws_url is None
+            or (connecting is not None and not connecting.done())
+            or time.monotonic() < self._trade_ws_retry_at
+        ):
+            return
+        self._trade_ws_connect = asyncio.create_task(self._ensure_trade_ws())
+
+    async def _connect_trade_ws(self, url: str) -> None:
+        ws = await websockets.connect(url, compression=None)
+        expires = int(time.time() * 1000) + 10_000
+        signature = hmac.new(
+            self._api_secret.encode(), f"GET/realtime{expires}".encode(), hashlib.sha256
+        ).hexdigest()
+        try:
+            await ws.send(
+                orjson.dumps(
+                    {"op": "auth", "args": [self._api_key, expires, signature]}
+                )
+            )
+            ack = orjson.loads(await ws.recv(decode=False))
+            if ack.get("retCode", -1) != 0:
+                # an OSError, so it is logged and retried like a failed connect
+                raise ConnectionError(
+                    f"Bybit trade WS auth failed: {ack.get('retMsg')}"
+                )
+        except BaseException:
+            await ws.close()
+            raise
+        self._trade_ws = ws
+        self._trade_ws_reader = asyncio.create_task(self._read_trade_ws(ws))
+
+    async def _read_trade_ws(self, ws: ClientConnection) -> None:
+        try:
+            async for message in ws:
+                try:
+                    msg = orjson.loads(message)
+                    future = self._ws_pending.pop(msg.get("reqId", ""), None)
+                except (orjson.JSONDecodeError, AttributeError):
+                    log.exception("Bybit trade WS: unreadable frame %r", message)
+                    continue
+                if future is not None and not future.done():
+                    future.set_result(msg)
+        except websockets.ConnectionClosed:
+            log.warning("Bybit trade WS closed — orders use REST until it reconnects")
+        except Exception:
+            log.exception("Bybit trade WS reader failed — orders use REST")
+            await ws.close()
+        finally:
+            self._trade_ws = None
+            pending, self._ws_pending = self._ws_pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Bybit trade WS closed"))
+
+    async def _ws_request(
+        self, ws: ClientConnection, op: str, args: dict[str, Any]
+    ) -> dict[str, Any]:
+        req_id = uuid.uuid4().hex
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._ws_pending[req_id] = future
+        frame = {
+            "reqId": req_id,
+            "header": {
+                "X-BAPI-TIMESTAMP": self._ts(),
+                "X-BAPI-RECV-WINDOW": _RECV_WINDOW,
+            },
+            "op": op,
+            "args": [args],
+        }
+        try:
+            await ws.send(orjson.dumps(frame))
+            return await asyncio.wait_for(future, _WS_ACK_TIMEOUT)
+        finally:
+            self._ws_pending.pop(req_id, None)
+
     # ------------------------------------------------------------------ helpers
 
     @staticmethod
@@ -120,23 +291,23 @@ class BybitBroker(BaseBroker):
     async def _get(self, path: str, params: dict[str, Any]) -> dict[str, Any]:
         query = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
         ts = self._ts()
+        # send the signed string verbatim: page cursors arrive URL-encoded,
+        # and letting httpx re-encode them would break the signature
         r = await self._client.get(
-            path, params=params, headers=self._auth_headers(ts, query)
+            f"{path}?{query}", headers=self._auth_headers(ts, query)
         )
         r.raise_for_status()
         return cast("dict[str, Any]", r.json())
 
     # ------------------------------------------------------------------ trading
 
-    async def place_order(self, order: Order) -> OrderResult:
-        client_oid = order.client_order_id or uuid.uuid4().hex[:16]
+    def _order_body(self, order: Order) -> dict[str, Any]:
         body: dict[str, Any] = {
-            "category": "linear",
             "symbol": order.symbol,
             "side": self._bybit_side(order.side),
             "orderType": self._bybit_order_type(order.order_type),
             "qty": str(order.quantity),
-            "clientOrderId": client_oid,
+            "clientOrderId": order.client_order_id or uuid.uuid4().hex[:16],
         }
         if isinstance(order, PerpOrder) and order.reduce_only:
             body["reduceOnly"] = True
@@ -145,9 +316,16 @@ class BybitBroker(BaseBroker):
             body["timeInForce"] = "GTC"
         else:
             body["timeInForce"] = "IOC"
+        return body
 
+    async def place_order(self, order: Order) -> OrderResult:
+        body = {"category": "linear", **self._order_body(order)}
         try:
-            resp = await self._post("/v5/order/create", body)
+            if (ws := self._trade_ws) is not None:
+                resp = await self._ws_request(ws, "order.create", body)
+            else:
+                self._reconnect_trade_ws()
+                resp = await self._post("/v5/order/create", body)
         except Exception as exc:
             return OrderResult(order_id=None, order=order, error=str(exc))
 
@@ -157,9 +335,53 @@ class BybitBroker(BaseBroker):
                 order_id=None, order=order, error=resp.get("retMsg", "unknown error")
             )
 
-        order_id = resp["result"].get("orderId", client_oid)
+        # REST acks carry the order under "result", WS acks under "data"
+        ack = resp.get("result") or resp.get("data") or {}
+        order_id = ack.get("orderId", body["clientOrderId"])
         return OrderResult(order_id=order_id, order=order, error=None)
 
+    async def place_orders(self, orders: list[Order]) -> list[OrderResult]:
+        """Submit *orders* through ``/v5/order/create-batch``.
+
+        Orders are sent in chunks of the endpoint's per-request limit, with
+        the chunks in flight concurrently.  Results keep the order of
+        *orders*; a per-order rejection lands in its ``error`` field.
+        """
+        chunks = [
+            orders[i : i + _BATCH_LIMIT] for i in range(0, len(orders), _BATCH_LIMIT)
+        ]
+        results = await asyncio.gather(*map(self._place_batch, chunks))
+        return [result for chunk in results for result in chunk]
+
+    async def _place_batch(self, orders: list[Order]) -> list[OrderResult]:
+        bodies = [self._order_body(order) for order in orders]
+        try:
+            resp = await self._post(
+                "/v5/order/create-batch", {"category": "linear", "request": bodies}
+            )
+        except Exception as exc:
+            return [OrderResult(order_id=None, order=o, error=str(exc)) for o in orders]
+
+        if resp.get("retCode", -1) != 0:
+            error = resp.get("retMsg", "unknown error")
+            return [OrderResult(order_id=None, order=o, error=error) for o in orders]
+
+        # result.list and retExtInfo.list are positional with the request list
+        placed = resp["result"].get("list", [])
+        statuses = resp.get("retExtInfo", {}).get("list", [])
+        results: list[OrderResult] = []
+        for i, (order, body) in enumerate(zip(orders, bodies, strict=True)):
+            status = statuses[i] if i < len(statuses) else {}
+            if status.get("code", 0) != 0:
+                results.append(
+                    OrderResult(order_id=None, order=order, error=status.get("msg"))
+                )
+                continue
+            entry = placed[i] if i < len(placed) else {}
+            order_id = entry.get("orderId") or body["clientOrderId"]
+            results.append(OrderResult(order_id=order_id, order=order, error=None))
+        return results
+
     async def cancel_order(self, order_id: str) -> OrderResult:
         try:
             resp = await self._post(
@@ -195,71 +417,140 @@ class BybitBroker(BaseBroker):
         params: dict[str, Any] = {"category": "linear", "limit": "50"}
         if symbol:
             params["symbol"] = symbol
+        else:
+            params["settleCoin"] = _SETTLE_COIN
+        items = await self._get_list("/v5/order/realtime", params)
+        return [self._to_order(o) for o in items]
+
+    async def position(self, symbol: str) -> PerpPosition | None:
+        items = await self._get_list(
+            "/v5/position/list",
+            {
+                "category": "linear",
+                "symbol": symbol,
+            },
+        )
+        # Bybit returns one-way and hedge positions; take the net non-zero entry
+        for item in items:
+            pos = self._to_position(item)
+            if pos is not None:
+                return pos
+        return None
+
+    async def snapshot(self, symbols: Sequence[str] | None = None) -> AccountSnapshot:
+        """Read open orders, positions and the wallet with three concurrent queries.
+
+        Each endpoint is queried for the whole ``USDT`` account rather than
+        per symbol, so the cost is one round trip however many *symbols* are
+        asked for — plus one per extra page on accounts with more than 50
+        open orders or 200 positions.  With ``symbols=None`` the snapshot
+        covers every symbol with an open order or position.
+
+        Unlike :meth:`open_orders` and :meth:`position`, failures raise: a
+        partial snapshot would be indistinguishable from a flat account.
+        """
+        order_items, position_items, wallets = await asyncio.gather(
+            self._get_all(
+                "/v5/order/realtime",
+                {"category": "linear", "settleCoin": _SETTLE_COIN, "limit": "50"},
+            ),
+            self._get_all(
+                "/v5/position/list",
+                {"category": "linear", "settleCoin": _SETTLE_COIN, "limit": "200"},
+            ),
+            self._get_all("/v5/account/wallet-balance", {"accountType": "UNIFIED"}),
+        )
+        orders = [self._to_order(o) for o in order_items]
+        by_symbol: dict[str, PerpPosition] = {}
+        for item in position_items:
+            pos = self._to_position(item)
+            if pos is not None:
+                by_symbol.setdefault(pos.symbol, pos)
+        if symbols is None:
+            symbols = sorted(by_symbol.keys() | {o.symbol for o in orders})
+        else:
+            wanted = set(symbols)
+            orders = [o for o in orders if o.symbol in wanted]
+        return AccountSnapshot(
+            symbols=tuple(symbols),
+            open_orders=tuple(orders),
+            positions=tuple(by_symbol.get(s) for s in symbols),
+            balances=wallets[0] if wallets else {},
+        )
+
+    async def _get_all(self, path: str, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """GET every page of ``result.list`` from *path*, following the cursor.
+
+        Raises :exc:`httpx.HTTPError` on transport failures and
+        :exc:`RuntimeError` when Bybit rejects the request.
+        """
+        items: list[dict[str, Any]] = []
+        page = params
+        while True:
+            resp = await self._get(path, page)
+            if resp.get("retCode", -1) != 0:
+                msg = f"Bybit {path} failed: {resp.get('retMsg', 'unknown error')}"
+                raise RuntimeError(msg)
+            result = resp.get("result", {})
+            items.extend(result.get("list", []))
+            cursor = result.get("nextPageCursor")
+            if not cursor:
+                return items
+            page = {**params, "cursor": cursor}
+
+    async def _get_list(
+        self, path: str, params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """GET *path* and return ``result.list``; empty on any failure."""
         try:
-            resp = await self._get("/v5/order/realtime", params)
+            resp = await self._get(path, params)
         except Exception:
             return []
         if resp.get("retCode", -1) != 0:
             return []
-        orders = []
-        for o in resp.get("result", {}).get("list", []):
-            side = OrderSide.BUY if o["side"] == "Buy" else OrderSide.SELL
-            ot = OrderType.MARKET if o["orderType"] == "Market" else OrderType.LIMIT
-            orders.append(
-                Order(
-                    symbol=o["symbol"],
-                    side=side,
-                    order_type=ot,
-                    quantity=Decimal(o["qty"]),
-                    price=Decimal(o.get("price") or "0"),
-                    client_order_id=o.get("clientOrderId"),
-                )
-            )
-        return orders
+        return cast("list[dict[str, Any]]", resp.get("result", {}).get("list", []))
 
-    async def position(self, symbol: str) -> PerpPosition | None:
-        try:
-            resp = await self._get(
-                "/v5/position/list",
-                {
-                    "category": "linear",
-                    "symbol": symbol,
-                },
-            )
-        except Exception:
-            return None
-        if resp.get("retCode", -1) != 0:
-            return None
+    @staticmethod
+    def _to_order(o: dict[str, Any]) -> Order:
+        side = OrderSide.BUY if o["side"] == "Buy" else OrderSide.SELL
+        ot = OrderType.MARKET if o["orderType"] == "Market" else OrderType.LIMIT
+        return Order(
+            symbol=o["symbol"],
+            side=side,
+            order_type=ot,
+            quantity=Decimal(o["qty"]),
+            price=Decimal(o.get("price") or "0"),
+            client_order_id=o.get("clientOrderId"),
+        )
 
-        items = resp.get("result", {}).get("list", [])
-        # Bybit returns one-way and hedge positions; take the net non-zero entry
-        for item in items:
-            qty = Decimal(item.get("size", "0"))
-            if qty == Decimal(0):
-                continue
-            side_sign = Decimal(1) if item.get("side") == "Buy" else Decimal(-1)
-            signed_qty = qty * side_sign
-            realized = Decimal(item.get("cumRealisedPnl", "0"))
-            unrealized = Decimal(item.get("unrealisedPnl", "0"))
-            mark = Decimal(item.get("markPrice", "0"))
-            avg_entry = Decimal(item.get("avgPrice", "0"))
-            liq_price = item.get("liqPrice")
-
-            # Update PnL cache per symbol so multi-symbol totals are correct
-            self._realized_pnl_cache[symbol] = realized  # PNL fix!!!
-            self._unrealized_pnl_cache[symbol] = unrealized  # PNL fix!!!
-
-            return PerpPosition(
-                symbol=symbol,
-                quantity=signed_qty,
-                avg_entry_price=avg_entry,
-                unrealized_pnl=unrealized,
-                realized_pnl=realized,
-                mark_price=mark,
-                liquidation_price=Decimal(liq_price) if liq_price else None,
-                funding_paid=None,
-            )
-        return None
+    def _to_position(self, item: dict[str, Any]) -> PerpPosition | None:
+        """Convert a position-list entry; ``None`` for an empty (flat) entry."""
+        qty = Decimal(item.get("size", "0"))
+        if qty == Decimal(0):
+            return None
+        symbol = item["symbol"]
+        side_sign = Decimal(1) if item.get("side") == "Buy" else Decimal(-1)
+        signed_qty = qty * side_sign
+        realized = Decimal(item.get("cumRealisedPnl", "0"))
+        unrealized = Decimal(item.get("unrealisedPnl", "0"))
+        mark = Decimal(item.get("markPrice", "0"))
+        avg_entry = Decimal(item.get("avgPrice", "0"))
+        liq_price = item.get("liqPrice")
+
+        # Update PnL cache per symbol so multi-symbol totals are correct
+        self._realized_pnl_cache[symbol] = realized  # PNL fix!!!
+        self._unrealized_pnl_cache[symbol] = unrealized  # PNL fix!!!
+
+        return PerpPosition(
+            symbol=symbol,
+            quantity=signed_qty,
+            avg_entry_price=avg_entry,
+            unrealized_pnl=unrealized,
+            realized_pnl=realized,
+            mark_price=mark,
+            liquidation_price=Decimal(liq_price) if liq_price else None,
+            funding_paid=None,
+        )
 
     # ------------------------------------------------------------------ account
 
@@ -298,4 +589,14 @@ class BybitBroker(BaseBroker):
     # ------------------------------------------------------------------ lifecycle
 
     async def aclose(self) -> None:
+        self._trade_ws_url = None  # no reconnects from here on
+        if self._trade_ws_connect is not None:
+            self._trade_ws_connect.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._trade_ws_connect
+        if self._trade_ws is not None:
+            await self._trade_ws.close()
+        if self._trade_ws_reader is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._trade_ws_reader
         await self._client.aclose()
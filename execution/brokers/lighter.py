@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import lighter
 from lighter.signer_client import SignerClient
 
+from data.normalizers.common import parse_decimal
 from execution.types import (
+    AccountSnapshot,
     Order,
     OrderResult,
     OrderSide,
@@ -22,10 +25,15 @@ from interfaces.broker import BaseBroker
 log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
     from lighter.models.account_position import AccountPosition as _LighterPosition
     from lighter.models.order import Order as _LighterOrder
 
 
+_BOOK_TTL = 0.01  # seconds a top-of-book snapshot is reused
+_MAX_CONCURRENT_QUERIES = 8  # parallel per-market REST reads; respects rate limits
+
 # Map canonical enums → Lighter integer constants
 _ORDER_TYPE: dict[OrderType, int] = {
     OrderType.LIMIT: SignerClient.ORDER_TYPE_LIMIT,
@@ -107,9 +115,27 @@ class LighterBroker(BaseBroker):
         self._account_api = lighter.AccountApi(self._signer.api_client)
         self._account_index = account_index
         self._symbol_map = symbol_map
-        self._index_map = {v: k for k, v in symbol_map.items()}  # reverse lookup
+        # market index -> unified symbol, for mapping account data back
+        self._symbol_of = {index: symbol for symbol, index in symbol_map.items()}
         self._price_scale = 10**price_decimals
         self._base_scale = base_scale
+        # scales as powers of ten, so encoding is a Decimal exponent shift
+        self._price_exp = price_decimals
+        self._base_exp = _power_of_ten(base_scale)
+        # symbol -> (monotonic fetch time, best bid, best ask)
+        self._book_cache: dict[str, tuple[float, Decimal, Decimal]] = {}
+        self._last_cancel_ms = 0
+        # per-type submit paths; each only assembles the fields its type uses
+        self._place_dispatch: dict[
+            OrderType, Callable[[PerpOrder], Awaitable[OrderResult]]
+        ] = {
+            OrderType.MARKET: self._place_market,
+            OrderType.LIMIT: self._place_limit,
+            OrderType.STOP_LOSS: self._place_triggered,
+            OrderType.STOP_LOSS_LIMIT: self._place_triggered,
+            OrderType.TAKE_PROFIT: self._place_triggered,
+            OrderType.TAKE_PROFIT_LIMIT: self._place_triggered,
+        }
 
     # ----------------------------------------------------------------- trading
 
@@ -125,36 +151,56 @@ class LighterBroker(BaseBroker):
                 f"LighterBroker.place_order requires a PerpOrder, got {cls}"
             )
 
-        market_index = self._resolve(order.symbol)
-        client_idx = int(order.client_order_id) if order.client_order_id else 0
-        trigger = (
-            _to_int(order.trigger_price, self._price_scale)
-            if order.trigger_price is not None
-            else SignerClient.NIL_TRIGGER_PRICE
-        )
+        return await self._place_dispatch[order.order_type](order)
 
+    async def _place_market(self, order: PerpOrder) -> OrderResult:
         # Best bid/ask at submission time — used as fill price proxy for
         # market orders since Lighter only returns a tx hash, not a fill price.
         fill_price: Decimal | None = None
-        if order.order_type is OrderType.MARKET:
-            try:
-                if order.side is OrderSide.BUY:
-                    fill_price = await self.best_ask(order.symbol)
-                else:
-                    fill_price = await self.best_bid(order.symbol)
-            except Exception:
-                log.debug(
-                    "fill price fetch failed — PnL will use reference price",
-                    exc_info=True,
-                )
+        try:
+            if order.side is OrderSide.BUY:
+                fill_price = await self.best_ask(order.symbol)
+            else:
+                fill_price = await self.best_bid(order.symbol)
+        except Exception:
+            log.debug(
+                "fill price fetch failed — PnL will use reference price",
+                exc_info=True,
+            )
+        return await self._submit(
+            order,
+            SignerClient.ORDER_TYPE_MARKET,
+            SignerClient.NIL_TRIGGER_PRICE,
+            fill_price,
+        )
+
+    async def _place_limit(self, order: PerpOrder) -> OrderResult:
+        return await self._submit(
+            order, SignerClient.ORDER_TYPE_LIMIT, SignerClient.NIL_TRIGGER_PRICE
+        )
+
+    async def _place_triggered(self, order: PerpOrder) -> OrderResult:
+        trigger = (
+            _to_int(order.trigger_price, self._price_exp)
+            if order.trigger_price is not None
+            else SignerClient.NIL_TRIGGER_PRICE
+        )
+        return await self._submit(order, _ORDER_TYPE[order.order_type], trigger)
 
+    async def _submit(
+        self,
+        order: PerpOrder,
+        order_type: int,
+        trigger: int,
+        fill_price: Decimal | None = None,
+    ) -> OrderResult:
         _tx, resp, err = await self._signer.create_order(
-            market_index,
-            client_idx,
-            _to_int(order.quantity, self._base_scale),
-            _to_int(order.price, self._price_scale),
+            self._resolve(order.symbol),
+            int(order.client_order_id) if order.client_order_id else 0,
+            _to_int(order.quantity, self._base_exp),
+            _to_int(order.price, self._price_exp),
             order.side is OrderSide.SELL,
-            _ORDER_TYPE[order.order_type],
+            order_type,
             _TIF[order.time_in_force],
             order.reduce_only,
             trigger,
@@ -174,10 +220,8 @@ class LighterBroker(BaseBroker):
 
         Obtain the correct *order_id* from :meth:`open_orders`.
         """
-        try:
-            market_str, index_str = order_id.split(":", 1)
-            market_index, order_index = int(market_str), int(index_str)
-        except ValueError:
+        market_str, _, index_str = order_id.partition(":")
+        if not (market_str.isdecimal() and index_str.isdecimal()):
             return OrderResult(
                 order_id=None,
                 order=None,
@@ -186,6 +230,7 @@ class LighterBroker(BaseBroker):
                     " Expected '<market>:<index>'."
                 ),
             )
+        market_index, order_index = int(market_str), int(index_str)
 
         _tx, resp, err = await self._signer.cancel_order(market_index, order_index)
         if err:
@@ -203,7 +248,10 @@ class LighterBroker(BaseBroker):
         protocol level; *symbol* is accepted for interface compatibility
         but ignored — all markets are cancelled.
         """
-        timestamp_ms = int(time.time() * 1_000)
+        # strictly increasing, so a burst of cancels within one millisecond
+        # never submits a duplicate timestamp
+        timestamp_ms = max(int(time.time() * 1_000), self._last_cancel_ms + 1)
+        self._last_cancel_ms = timestamp_ms
         _tx, resp, err = await self._signer.cancel_all_orders(
             SignerClient.CANCEL_ALL_TIF_IMMEDIATE, timestamp_ms
         )
@@ -220,7 +268,8 @@ class LighterBroker(BaseBroker):
     async def open_orders(self, symbol: str | None = None) -> list[Order]:
         """Return open orders, optionally filtered to *symbol*.
 
-        If *symbol* is ``None``, all markets in ``symbol_map`` are queried.
+        If *symbol* is ``None``, all markets in ``symbol_map`` are queried
+        concurrently (at most ``_MAX_CONCURRENT_QUERIES`` at a time).
         Each returned :class:`~execution.types.PerpOrder` carries
         ``client_order_id`` encoded as ``"{market_index}:{order_index}"``
         so it can be passed directly to :meth:`cancel_order`.
@@ -231,11 +280,18 @@ class LighterBroker(BaseBroker):
             if symbol is not None
             else list(self._symbol_map.items())
         )
+        limit = asyncio.Semaphore(_MAX_CONCURRENT_QUERIES)
+
+        async def active_orders(market_index: int) -> Any:
+            async with limit:
+                return await self._order_api.account_active_orders(
+                    self._account_index, market_index, auth=auth
+                )
+
+        # one request per market, all in flight at once
+        responses = await asyncio.gather(*(active_orders(mi) for _, mi in markets))
         orders: list[Order] = []
-        for sym, market_index in markets:
-            resp = await self._order_api.account_active_orders(
-                self._account_index, market_index, auth=auth
-            )
+        for (sym, _), resp in zip(markets, responses, strict=True):
             for raw in resp.orders:
                 orders.append(
                     _to_perp_order(raw, sym, self._price_scale, self._base_scale)
@@ -255,17 +311,71 @@ class LighterBroker(BaseBroker):
                 return _to_perp_position(raw, symbol)
         return None
 
+    async def snapshot(self, symbols: Sequence[str] | None = None) -> AccountSnapshot:
+        """Read positions and balances from one account request.
+
+        :meth:`position` fetches the whole account for a single symbol; here
+        it is fetched once for all of them, concurrently with the open-order
+        queries.  With ``symbols=None`` every market in ``symbol_map`` is
+        queried and the snapshot covers those with an open order or position.
+        """
+        wanted = list(self._symbol_map) if symbols is None else list(symbols)
+        account, orders = await asyncio.gather(
+            self._account_api.account(by="index", value=str(self._account_index)),
+            self.open_orders() if symbols is None else self._orders_of(wanted),
+        )
+        positions: dict[str, PerpPosition] = {}
+        balances: dict[str, Any] = {}
+        if account.accounts:
+            acct = account.accounts[0]
+            balances = {
+                "collateral": acct.collateral,
+                "available_balance": acct.available_balance,
+            }
+            for raw in acct.positions or []:
+                sym = self._symbol_of.get(raw.market_id)
+                if sym is not None and parse_decimal(raw.position) != 0:
+                    positions[sym] = _to_perp_position(raw, sym)
+        if symbols is None:
+            wanted = sorted(positions.keys() | {o.symbol for o in orders})
+        return AccountSnapshot(
+            symbols=tuple(wanted),
+            open_orders=tuple(orders),
+            positions=tuple(positions.get(s) for s in wanted),
+            balances=balances,
+        )
+
+    async def _orders_of(self, symbols: list[str]) -> list[Order]:
+        per_symbol = await asyncio.gather(*(self.open_orders(s) for s in symbols))
+        return [o for orders in per_symbol for o in orders]
+
     # ------------------------------------------------------ market data helpers
 
+    async def best_bid_ask(self, symbol: str) -> tuple[Decimal, Decimal]:
+        """Return the current ``(best_bid, best_ask)`` for *symbol*.
+
+        Both sides come from one order-book request.  The result is reused
+        for ``_BOOK_TTL`` seconds so back-to-back :meth:`best_bid` /
+        :meth:`best_ask` calls cost a single round trip.
+        """
+        now = time.monotonic()
+        cached = self._book_cache.get(symbol)
+        if cached is not None and now - cached[0] < _BOOK_TTL:
+            return cached[1], cached[2]
+        ob = await self._order_api.order_book_orders(self._resolve(symbol), 1)
+        bid, ask = Decimal(ob.bids[0].price), Decimal(ob.asks[0].price)
+        self._book_cache[symbol] = (time.monotonic(), bid, ask)
+        return bid, ask
+
     async def best_bid(self, symbol: str) -> Decimal:
         """Return the current best bid price for *symbol*."""
-        ob = await self._order_api.order_book_orders(self._resolve(symbol), 1)
-        return Decimal(ob.bids[0].price)
+        bid, _ask = await self.best_bid_ask(symbol)
+        return bid
 
     async def best_ask(self, symbol: str) -> Decimal:
         """Return the current best ask price for *symbol*."""
-        ob = await self._order_api.order_book_orders(self._resolve(symbol), 1)
-        return Decimal(ob.asks[0].price)
+        _bid, ask = await self.best_bid_ask(symbol)
+        return ask
 
     # ----------------------------------------------------------------- lifecycle
 
@@ -332,9 +442,21 @@ class LighterTestnetBroker(LighterBroker):
 # ---------------------------------------------------------------------------
 
 
-def _to_int(value: Decimal, scale: int) -> int:
-    """Scale a human-readable :class:`~decimal.Decimal` to a Lighter integer."""
-    return int(value * scale)
+def _to_int(value: Decimal, exp: int) -> int:
+    """Scale a human-readable :class:`~decimal.Decimal` to a Lighter integer.
+
+    *exp* is the power of ten of the scale; shifting the exponent avoids a
+    general ``Decimal`` multiply.  Excess digits are truncated toward zero.
+    """
+    return int(value.scaleb(exp))
+
+
+def _power_of_ten(scale: int) -> int:
+    """Return ``k`` such that ``scale == 10**k``."""
+    exp = len(str(scale)) - 1
+    if scale != 10**exp:
+        raise ValueError(f"base_scale must be a power of 10, got {scale}")
+    return exp
 
 
 _LIGHTER_TYPE_MAP: dict[str, OrderType] = {
@@ -360,13 +482,13 @@ def _to_perp_order(
     base_scale: int,
 ) -> PerpOrder:
     """Convert a Lighter API order to a :class:`~execution.types.PerpOrder`."""
-    trigger_raw = Decimal(raw.trigger_price)
+    trigger_raw = parse_decimal(raw.trigger_price)
     return PerpOrder(
         symbol=symbol,
         side=OrderSide.SELL if raw.is_ask else OrderSide.BUY,
         order_type=_LIGHTER_TYPE_MAP.get(raw.type, OrderType.LIMIT),
-        quantity=Decimal(raw.initial_base_amount),
-        price=Decimal(raw.price),
+        quantity=parse_decimal(raw.initial_base_amount),
+        price=parse_decimal(raw.price),
         time_in_force=_LIGHTER_TIF_MAP.get(raw.time_in_force, TimeInForce.GTT),
         client_order_id=f"{raw.market_index}:{raw.order_index}",
         reduce_only=raw.reduce_only,
@@ -377,17 +499,17 @@ def _to_perp_order(
 
 def _to_perp_position(raw: _LighterPosition, symbol: str) -> PerpPosition:
     """Convert a Lighter API position to a :class:`~execution.types.PerpPosition`."""
-    signed_qty = Decimal(raw.position) * raw.sign
+    signed_qty = parse_decimal(raw.position) * raw.sign
     return PerpPosition(
         symbol=symbol,
         quantity=signed_qty,
-        avg_entry_price=Decimal(raw.avg_entry_price),
-        unrealized_pnl=Decimal(raw.unrealized_pnl),
-        realized_pnl=Decimal(raw.realized_pnl),
-        liquidation_price=Decimal(raw.liquidation_price)
+        avg_entry_price=parse_decimal(raw.avg_entry_price),
+        unrealized_pnl=parse_decimal(raw.unrealized_pnl),
+        realized_pnl=parse_decimal(raw.realized_pnl),
+        liquidation_price=parse_decimal(raw.liquidation_price)
         if raw.liquidation_price
         else None,
-        funding_paid=Decimal(raw.total_funding_paid_out)
+        funding_paid=parse_decimal(raw.total_funding_paid_out)
         if raw.total_funding_paid_out
         else None,
     )
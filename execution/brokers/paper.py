@@ -84,6 +84,7 @@ class PaperBroker(BaseBroker):
         self._fee_rate = fee_rate
         self._positions: dict[str, _PaperPosition] = {}
         self._trade_history: list[PaperFill] = []
+        self._fees_paid = Decimal(0)
         self._order_counter: int = 0
 
     # ----------------------------------------------------------------- market data
@@ -157,6 +158,7 @@ class PaperBroker(BaseBroker):
         if not pos.market_price:
             pos.market_price = fill_price
 
+        self._fees_paid += fee
         self._trade_history.append(
             PaperFill(
                 order_id=order_id,
@@ -215,15 +217,15 @@ class PaperBroker(BaseBroker):
 
     @property
     def total_realized_pnl(self) -> Decimal:
-        return sum((p.realized_pnl for p in self._positions.values()), Decimal(0))
+        return sum([p.realized_pnl for p in self._positions.values()], Decimal(0))
 
     @property
     def total_unrealized_pnl(self) -> Decimal:
-        return sum((p.unrealized_pnl() for p in self._positions.values()), Decimal(0))
+        return sum([p.unrealized_pnl() for p in self._positions.values()], Decimal(0))
 
     @property
     def total_fees_paid(self) -> Decimal:
-        return sum((f.fee for f in self._trade_history), Decimal(0))
+        return self._fees_paid
 
     # ----------------------------------------------------------------- lifecycle
 
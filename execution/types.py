@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from decimal import Decimal
@@ -33,7 +33,7 @@ class TimeInForce(StrEnum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Order:
     """Exchange-agnostic order request.
 
@@ -59,7 +59,7 @@ class Order:
     client_order_id: str | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PerpOrder(Order):
     """Perpetual futures order — extends :class:`Order` with perp-specific fields.
 
@@ -72,7 +72,7 @@ class PerpOrder(Order):
     order_expiry: int = -1
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EquityOrder(Order):
     """Equity / stock order — adds exchange routing and currency."""
 
@@ -80,7 +80,7 @@ class EquityOrder(Order):
     currency: str = "USD"
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FXOrder(Order):
     """FX spot / forward order.
 
@@ -97,7 +97,7 @@ class FXOrder(Order):
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class OrderResult:
     """Returned by a broker after placing or canceling an order.
 
@@ -128,7 +128,7 @@ class OrderResult:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FillConfirmation:
     """Published by the consolidator back to each strategy worker after a fill.
 
@@ -148,7 +148,7 @@ class FillConfirmation:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Position:
     """Open position in any instrument.
 
@@ -162,10 +162,31 @@ class Position:
     realized_pnl: Decimal
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class PerpPosition(Position):
     """Perpetual futures position — extends :class:`Position` with perp fields."""
 
     liquidation_price: Decimal | None = None
     funding_paid: Decimal | None = None
     mark_price: Decimal | None = None
+
+
+# ---------------------------------------------------------------------------
+# Account snapshot
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class AccountSnapshot:
+    """Open orders, positions and balances read together.
+
+    ``positions`` is positional: ``positions[i]`` is the position in
+    ``symbols[i]``, or ``None`` if flat.  ``open_orders`` covers the same
+    symbols.  ``balances`` is the venue's raw balance record; empty when the
+    broker does not report one.
+    """
+
+    symbols: tuple[str, ...]
+    open_orders: tuple[Order, ...]
+    positions: tuple[Position | None, ...]
+    balances: dict[str, Any]
@@ -1,4 +1,11 @@
+from interfaces._loop import setup_fast_loop
 from interfaces.client import BaseCryptoClient
-from interfaces.strategy import BaseStrategy
+from interfaces.strategy import AsyncStrategy, BaseStrategy, StrategyLike
 
-__all__ = ["BaseCryptoClient", "BaseStrategy"]
+__all__ = [
+    "AsyncStrategy",
+    "BaseCryptoClient",
+    "BaseStrategy",
+    "StrategyLike",
+    "setup_fast_loop",
+]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+
+
+def install_eager_task_factory() -> None:
+    """Run new tasks eagerly on the current event loop (Python 3.12+).
+
+    With :func:`asyncio.eager_task_factory` a task starts executing inside
+    ``create_task`` and only yields to the scheduler at its first real
+    suspension, so coroutines that finish synchronously — cache hits,
+    already-buffered frames — skip a loop iteration.  A no-op on older
+    interpreters or when the loop already has a task factory.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is None:
+        return
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is None:
+        loop.set_task_factory(factory)
+
+
+def setup_fast_loop() -> bool:
+    """Make :mod:`uvloop` the event loop for later :func:`asyncio.run` calls.
+
+    uvloop replaces asyncio's selector and transport layer with libuv, which
+    roughly halves per-frame overhead for the socket-bound WebSocket readers
+    and HTTP clients behind brokers and data clients.  Call it once at
+    process start, before the loop exists.  Returns ``False`` — leaving the
+    default loop in place — on Windows or when uvloop is not installed
+    (``pip install infrastructure[fast]``).
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
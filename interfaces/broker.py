@@ -1,12 +1,32 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from execution.types import AccountSnapshot
+from interfaces._loop import install_eager_task_factory
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import TracebackType
+
     from execution.types import Order, OrderResult, Position
 
 
+class BrokerCapability(StrEnum):
+    """Optional behaviours a broker implements natively (see ``capabilities``)."""
+
+    BATCH_PLACE = "batch_place"  # place_orders is one venue request
+    BATCH_CANCEL = "batch_cancel"  # cancel_orders is one venue request
+    CANCEL_BY_SYMBOL = "cancel_by_symbol"  # cancel_all_orders honours symbol
+    WS_TRADE = "ws_trade"  # orders can go over a persistent WebSocket
+    PIPELINE = "pipeline"  # _send_pipeline packs dependent ops in one message
+
+
 class BaseBroker(ABC):
     """Contract that every broker implementation must fulfil.
 
@@ -15,14 +35,34 @@ class BaseBroker(ABC):
     types from :mod:`execution.types`.
 
     ``symbol`` follows a unified naming convention throughout; each broker
-    resolves it to its native format internally.
+    resolves it to its native format internally.  The mapping is
+    deterministic, so build it once — in ``__init__`` or :meth:`_warmup` —
+    and resolve with a plain dict lookup; never a string transform or an
+    API call per order.
+
+    Brokers that talk REST should create one HTTP client (for ``httpx``,
+    ``http2=True`` with keep-alive limits) when constructed, reuse it for
+    every call and close it in :meth:`aclose` — never a client per request,
+    which pays a TCP and TLS handshake on every order.
+
+    Brokers are I/O-bound; processes running them should call
+    :func:`interfaces.setup_fast_loop` before starting the event loop.
     """
 
+    __slots__ = ()
+
+    capabilities: ClassVar[frozenset[BrokerCapability]] = frozenset()
+    """What this broker does natively; anything absent uses a generic fallback."""
+
     # ----------------------------------------------------------------- trading
 
     @abstractmethod
     async def place_order(self, order: Order) -> OrderResult:
-        """Sign and submit *order*.  Always inspect ``result.error``."""
+        """Sign and submit *order*.  Always inspect ``result.error``.
+
+        Implementations look up the native symbol in a prebuilt map (see the
+        class docstring) rather than deriving it on every call.
+        """
         ...
 
     @abstractmethod
@@ -39,11 +79,65 @@ class BaseBroker(ABC):
     async def cancel_all_orders(self, symbol: str | None = None) -> OrderResult:
         """Cancel every open order, optionally filtered to *symbol*.
 
-        Brokers that do not support per-symbol cancellation will cancel all
-        markets and document that behaviour in their docstring.
+        Brokers without :attr:`BrokerCapability.CANCEL_BY_SYMBOL` cancel all
+        markets regardless of *symbol*.
         """
         ...
 
+    async def place_orders(self, orders: list[Order]) -> list[OrderResult]:
+        """Submit several orders; results correspond positionally to *orders*.
+
+        The default issues concurrent :meth:`place_order` calls.  Brokers
+        whose venue has a native batch endpoint should override this to send
+        a single request, mapping per-order failures into
+        :attr:`~execution.types.OrderResult.error`.
+        """
+        return list(await asyncio.gather(*map(self.place_order, orders)))
+
+    async def cancel_orders(self, order_ids: list[str]) -> list[OrderResult]:
+        """Cancel several orders; results correspond positionally to *order_ids*.
+
+        The default issues concurrent :meth:`cancel_order` calls; override
+        with a native batch cancel where the venue provides one.
+        """
+        return list(await asyncio.gather(*map(self.cancel_order, order_ids)))
+
+    def pipeline(self) -> BrokerPipeline:
+        """Return a :class:`BrokerPipeline` that queues calls and sends them together.
+
+        Usage::
+
+            async with broker.pipeline() as pipe:
+                cancel = pipe.cancel_order(old_id)
+                pipe.place_order(new_order, after=cancel)
+            cancelled, placed = pipe.results
+        """
+        return BrokerPipeline(self)
+
+    async def _send_pipeline(self, ops: Sequence[PipelineOp]) -> list[Any]:
+        """Execute *ops* and return their results in order.
+
+        The default runs every op as soon as the op it depends on has
+        finished, so independent calls overlap and only true dependencies
+        serialise.  Brokers whose venue accepts several dependent actions
+        in one signed message should override this.
+        """
+        tasks: list[asyncio.Future[Any]] = []
+        for op in ops:
+            dependency = tasks[op.input_from] if op.input_from is not None else None
+            tasks.append(asyncio.ensure_future(self._run_op(op, dependency)))
+        return list(await asyncio.gather(*tasks))
+
+    async def _run_op(
+        self, op: PipelineOp, dependency: asyncio.Future[Any] | None
+    ) -> Any:
+        args = op.args
+        if dependency is not None:
+            upstream = await dependency
+            if op.build is not None:
+                args = op.build(upstream)
+        return await getattr(self, op.method)(*args)
+
     # --------------------------------------------------------------- read-only
 
     @abstractmethod
@@ -56,6 +150,32 @@ class BaseBroker(ABC):
         """Return the current position for *symbol*, or ``None`` if flat."""
         ...
 
+    async def snapshot(self, symbols: Sequence[str] | None = None) -> AccountSnapshot:
+        """Return open orders and positions for *symbols* in one call.
+
+        With ``symbols=None`` the snapshot covers every symbol with an open
+        order.  The default reads all open orders once and the positions
+        concurrently; brokers whose venue can return the whole account in a
+        few requests should override it.
+        """
+        if symbols is None:
+            orders = await self.open_orders()
+            symbols = sorted({o.symbol for o in orders})
+            positions = await asyncio.gather(*(self.position(s) for s in symbols))
+        else:
+            orders, positions = await asyncio.gather(
+                self.open_orders(),
+                asyncio.gather(*(self.position(s) for s in symbols)),
+            )
+            wanted = set(symbols)
+            orders = [o for o in orders if o.symbol in wanted]
+        return AccountSnapshot(
+            symbols=tuple(symbols),
+            open_orders=tuple(orders),
+            positions=tuple(positions),
+            balances={},
+        )
+
     # ----------------------------------------------------------------- lifecycle
 
     @abstractmethod
@@ -63,8 +183,223 @@ class BaseBroker(ABC):
         """Release any held connections or resources."""
         ...
 
+    async def _ensure_trade_ws(self) -> None:  # noqa: B027
+        """Open the broker's persistent order-entry WebSocket, if it has one.
+
+        Called from :meth:`_warmup` so the signed session is connected
+        before the first order rather than on it.  Brokers with a WS trading
+        API override this; the default is a no-op and orders go over REST.
+        """
+
+    async def _warmup(self) -> None:
+        """Open connections and load metadata before the first order.
+
+        Awaited by :meth:`__aenter__` so the first :meth:`place_order` inside
+        ``async with`` does not pay connection or authentication setup.  The
+        default opens the trade WebSocket; brokers extend it with their own
+        HTTP pool and market metadata, run concurrently.
+        """
+        await self._ensure_trade_ws()
+
     async def __aenter__(self) -> BaseBroker:
+        install_eager_task_factory()
+        await self._warmup()
         return self
 
     async def __aexit__(self, *_: object) -> None:
         await self.aclose()
+
+
+class BatchingBrokerMixin(BaseBroker):
+    """Opt-in coalescing of :meth:`place_order` calls into batch submissions.
+
+    Mix in ahead of a broker whose ``capabilities`` include
+    :attr:`BrokerCapability.BATCH_PLACE`::
+
+        class BatchingBybitBroker(BatchingBrokerMixin, BybitBroker):
+            max_wait_ms = 0.5
+
+    Inside ``async with``, each :meth:`place_order` enqueues the order and
+    awaits its own result.  A background task takes the first queued order,
+    gathers more until ``max_batch_size`` orders are queued or
+    ``max_wait_ms`` has passed, submits them in one :meth:`place_orders` call
+    and hands each caller its positional result.  Outside the context
+    manager, orders go straight to the wrapped broker.
+    """
+
+    max_batch_size: ClassVar[int] = 10
+    max_wait_ms: ClassVar[float] = 1.0
+
+    _order_queue: asyncio.Queue[tuple[Order, asyncio.Future[OrderResult]]]
+    _flusher: asyncio.Task[None] | None = None
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # the default place_orders fans back out to place_order, which would
+        # re-enter the queue and deadlock the flusher
+        if (
+            not getattr(cls, "__abstractmethods__", None)
+            and BrokerCapability.BATCH_PLACE not in cls.capabilities
+        ):
+            raise TypeError(
+                f"{cls.__name__} uses BatchingBrokerMixin but its broker has no"
+                " native batch placement (BrokerCapability.BATCH_PLACE)"
+            )
+
+    async def place_order(self, order: Order) -> OrderResult:
+        if self._flusher is None:
+            return await super().place_order(order)  # type: ignore[safe-super]
+        future: asyncio.Future[OrderResult] = asyncio.get_running_loop().create_future()
+        self._order_queue.put_nowait((order, future))
+        return await future
+
+    async def _flush_orders(self) -> None:
+        queue = self._order_queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_wait_ms / 1_000
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            try:
+                results = await self.place_orders([order for order, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    async def __aenter__(self) -> BaseBroker:
+        await super().__aenter__()
+        self._order_queue = asyncio.Queue()
+        self._flusher = asyncio.create_task(self._flush_orders())
+        return self
+
+    async def aclose(self) -> None:
+        if self._flusher is not None:
+            flusher, self._flusher = self._flusher, None
+            flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await flusher
+            while not self._order_queue.empty():
+                _, future = self._order_queue.get_nowait()
+                future.set_exception(ConnectionError("broker closed"))
+        await super().aclose()  # type: ignore[safe-super]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PipelineOp:
+    """One queued broker call inside a :class:`BrokerPipeline`.
+
+    ``method`` names a :class:`BaseBroker` coroutine.  When ``input_from``
+    is set the call waits for that earlier op; if ``build`` is also set, it
+    receives that op's result and returns the call's arguments in place of
+    ``args``.
+    """
+
+    method: str
+    args: tuple[Any, ...] = ()
+    input_from: int | None = None
+    build: Callable[[Any], tuple[Any, ...]] | None = None
+
+
+class BrokerPipeline:
+    """Collects dependent broker calls and sends them as one unit on exit.
+
+    Each call method returns the op's index, which later ops can name as
+    ``after`` (run once it completes) or ``input_from`` (run once it
+    completes and derive the call from its result)::
+
+        async with broker.pipeline() as pipe:
+            pos = pipe.position("BTC-USDC")
+            pipe.place_order(
+                input_from=pos,
+                build=lambda p: PerpOrder(..., quantity=abs(p.quantity) / 2),
+            )
+
+    Ops are dispatched through the broker's ``_send_pipeline`` when the
+    block exits without an exception; :attr:`results` then holds one
+    result per op.
+    """
+
+    __slots__ = ("_broker", "_ops", "results")
+
+    def __init__(self, broker: BaseBroker) -> None:
+        self._broker = broker
+        self._ops: list[PipelineOp] = []
+        self.results: list[Any] = []
+
+    def place_order(
+        self,
+        order: Order | None = None,
+        *,
+        after: int | None = None,
+        input_from: int | None = None,
+        build: Callable[[Any], Order] | None = None,
+    ) -> int:
+        if build is not None:
+            if input_from is None:
+                raise ValueError("build requires input_from")
+            return self._add(
+                "place_order", input_from=input_from, build=lambda r: (build(r),)
+            )
+        if order is None:
+            raise ValueError("place_order needs an order or a build function")
+        return self._add("place_order", order, input_from=after)
+
+    def cancel_order(self, order_id: str, *, after: int | None = None) -> int:
+        return self._add("cancel_order", order_id, input_from=after)
+
+    def cancel_all_orders(
+        self, symbol: str | None = None, *, after: int | None = None
+    ) -> int:
+        return self._add("cancel_all_orders", symbol, input_from=after)
+
+    def open_orders(
+        self, symbol: str | None = None, *, after: int | None = None
+    ) -> int:
+        return self._add("open_orders", symbol, input_from=after)
+
+    def position(self, symbol: str, *, after: int | None = None) -> int:
+        return self._add("position", symbol, input_from=after)
+
+    def _add(
+        self,
+        method: str,
+        *args: Any,
+        input_from: int | None,
+        build: Callable[[Any], tuple[Any, ...]] | None = None,
+    ) -> int:
+        if input_from is not None and not 0 <= input_from < len(self._ops):
+            raise ValueError(f"op {input_from} is not an earlier op in this pipeline")
+        self._ops.append(
+            PipelineOp(method=method, args=args, input_from=input_from, build=build)
+        )
+        return len(self._ops) - 1
+
+    async def __aenter__(self) -> BrokerPipeline:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None and self._ops:
+            self.results = await self._broker._send_pipeline(self._ops)
@@ -1,15 +1,40 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from enum import StrEnum
 from typing import TYPE_CHECKING, ClassVar
 
+from interfaces._loop import install_eager_task_factory
+
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
-    from datetime import datetime
+    from collections.abc import AsyncIterator
     from decimal import Decimal
 
     from data.connectors.types import KlineInterval
-    from data.types import DollarBar, FundingRate, TickBar, TimeBar, Trade, VolumeBar
+    from data.types import (
+        DollarBar,
+        FeedHealth,
+        FundingRate,
+        TickBar,
+        TimeBar,
+        Trade,
+        VolumeBar,
+    )
+
+    _BarKey = tuple[str, KlineInterval, datetime, datetime]
+
+_BAR_CACHE_SIZE = 256  # cached time_bars windows per client
+
+
+class OverflowPolicy(StrEnum):
+    """What a live stream does when its consumer is ``max_lag`` events behind."""
+
+    DROP_OLDEST = "drop_oldest"  # discard the oldest buffered event
+    BLOCK = "block"  # hold the client fan-out until the consumer catches up
+    ERROR = "error"  # end the stream with asyncio.QueueFull
 
 
 class BaseCryptoClient(ABC):
@@ -18,17 +43,39 @@ class BaseCryptoClient(ABC):
     Concrete implementations (e.g. ``BinanceClient``) hide all
     connector / normalizer wiring so callers only deal with canonical
     types from ``data.types``.
+
+    Every ``live_*`` stream buffers at most ``max_lag`` events for its
+    consumer and applies ``on_overflow`` once that buffer is full;
+    :attr:`lag_events` counts how often that has happened, so a strategy can
+    tell when it is falling behind the feed.  ``BLOCK`` is not lossless end
+    to end: it holds the client's fan-out, but the socket reader beneath
+    keeps its own bounded per-stream buffer and drops the oldest event when
+    that fills — those drops are counted in :attr:`lag_events` too.
+
+    Live streams are socket-bound; processes running clients should call
+    :func:`interfaces.setup_fast_loop` before starting the event loop.
     """
 
+    __slots__ = ()
+
     symbols: ClassVar[list[str]] = []
     """Symbols this client streams live data for (e.g. ``["BTCUSDT"]``)."""
 
     intervals: ClassVar[list[KlineInterval]] = []
     """Bar intervals to stream for each symbol (e.g. ``[KlineInterval.M1]``)."""
 
+    # key -> (monotonic expiry, bars); insertion order doubles as LRU order
+    _bar_cache: dict[_BarKey, tuple[float, list[TimeBar]]]
+    _bar_fetches: dict[_BarKey, asyncio.Task[list[TimeBar]]]
+
+    def __init__(self) -> None:
+        # state behind time_bars(); subclasses must call super().__init__().
+        # The slots stay empty, so it lives in the concrete client's __dict__.
+        self._bar_cache = {}  # type: ignore[misc]
+        self._bar_fetches = {}  # type: ignore[misc]
+
     # ---------------------------------------------------------------- historical
 
-    @abstractmethod
     async def time_bars(
         self,
         symbol: str,
@@ -36,7 +83,50 @@ class BaseCryptoClient(ABC):
         *,
         start: datetime,
         end: datetime,
-    ) -> list[TimeBar]: ...
+    ) -> list[TimeBar]:
+        """Return the closed time bars for *symbol* in [*start*, *end*].
+
+        Results are cached per argument tuple.  A window that ended at least
+        one *interval* ago can no longer change and is kept until evicted;
+        one reaching into the live tail expires after one *interval*.
+        Concurrent identical calls share a single :meth:`_fetch_time_bars`.
+        """
+        key = (symbol, interval, start, end)
+        now = time.monotonic()
+        cached = self._bar_cache.get(key)
+        if cached is not None and cached[0] > now:
+            self._bar_cache[key] = self._bar_cache.pop(key)
+            return list(cached[1])
+
+        task = self._bar_fetches.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_time_bars(symbol, interval, start=start, end=end)
+            )
+            self._bar_fetches[key] = task
+            task.add_done_callback(lambda _: self._bar_fetches.pop(key, None))
+        bars = await asyncio.shield(task)
+
+        closed = end if end.tzinfo is not None else end.replace(tzinfo=UTC)
+        age = (datetime.now(UTC) - closed).total_seconds()
+        ttl = float("inf") if age >= interval.seconds else interval.seconds
+        self._bar_cache.pop(key, None)
+        self._bar_cache[key] = (now + ttl, bars)
+        if len(self._bar_cache) > _BAR_CACHE_SIZE:
+            del self._bar_cache[next(iter(self._bar_cache))]
+        return list(bars)
+
+    @abstractmethod
+    async def _fetch_time_bars(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start: datetime,
+        end: datetime,
+    ) -> list[TimeBar]:
+        """Download the bars behind :meth:`time_bars`, bypassing its cache."""
+        ...
 
     @abstractmethod
     async def volume_bars(
@@ -72,20 +162,50 @@ class BaseCryptoClient(ABC):
         self,
         symbol: str,
         interval: KlineInterval,
-    ) -> AsyncGenerator[TimeBar, None]: ...
+        *,
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[TimeBar]: ...
 
     @abstractmethod
     def live_trades(
         self,
         symbol: str,
-    ) -> AsyncGenerator[Trade, None]: ...
+        *,
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[Trade]: ...
+
+    @property
+    @abstractmethod
+    def lag_events(self) -> int:
+        """Times a live-stream event met a full buffer, at any layer."""
+
+    @abstractmethod
+    async def feed_health(self, symbol: str) -> FeedHealth:
+        """Freshness of *symbol*'s live feed.
+
+        Lets a strategy notice a silently delayed stream — e.g. ``lag_ms``
+        above a few hundred milliseconds — and fall back to REST before
+        trading on stale prices.
+        """
 
     # ----------------------------------------------------------------- lifecycle
 
     @abstractmethod
     async def aclose(self) -> None: ...
 
+    async def _warmup(self) -> None:  # noqa: B027
+        """Open connections and load metadata before the first call.
+
+        Awaited by :meth:`__aenter__` so ``async with`` hands back a client
+        whose first request does not pay connection setup.  The default does
+        nothing.
+        """
+
     async def __aenter__(self) -> BaseCryptoClient:
+        install_eager_task_factory()
+        await self._warmup()
         return self
 
     async def __aexit__(self, *_: object) -> None:
@@ -100,8 +220,13 @@ class BaseCryptoFuturesClient(BaseCryptoClient):
     ``BaseCryptoClient`` directly.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def live_funding_rates(
         self,
         symbol: str,
-    ) -> AsyncGenerator[FundingRate, None]: ...
+        *,
+        max_lag: int = 1_024,
+        on_overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[FundingRate]: ...
@@ -2,14 +2,59 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, Protocol
 
 if TYPE_CHECKING:
-    from data.types import AnyBar, FundingRate, Trade
+    from collections.abc import Callable
+
+    from data.types import AnyBar, BarBatch, FundingRate, Trade
     from execution.types import FillConfirmation
     from interfaces.signals import TargetPosition
 
 
+class StrategyLike(Protocol):
+    """The callbacks :class:`~engine.strategy.runner.StrategyRunner` drives.
+
+    A structural type: anything with these methods can be run, whether or
+    not it inherits :class:`BaseStrategy` — e.g. a strategy implemented as
+    an extension type, which cannot derive from an ``ABC``.
+    """
+
+    def on_start(self) -> None: ...
+
+    def on_bar(self, bar: AnyBar) -> TargetPosition | None: ...
+
+    def trade_callback(self) -> Callable[[Trade], TargetPosition | None]: ...
+
+    def on_funding_rate(self, rate: FundingRate) -> TargetPosition | None: ...
+
+    def on_fill(self, fill: FillConfirmation) -> TargetPosition | None: ...
+
+    def on_stop(self) -> None: ...
+
+
+class AsyncStrategy(Protocol):
+    """A strategy whose event callbacks are coroutines.
+
+    For strategies that await I/O while handling an event.  The runner
+    checks each callback once, at construction, and only awaits those that
+    are coroutine functions, so synchronous callbacks never pay for a
+    coroutine per event.  Callbacks may mix sync and async freely.
+    """
+
+    async def on_start(self) -> None: ...
+
+    async def on_bar(self, bar: AnyBar) -> TargetPosition | None: ...
+
+    async def on_trade(self, trade: Trade) -> TargetPosition | None: ...
+
+    async def on_funding_rate(self, rate: FundingRate) -> TargetPosition | None: ...
+
+    async def on_fill(self, fill: FillConfirmation) -> TargetPosition | None: ...
+
+    async def on_stop(self) -> None: ...
+
+
 class BaseStrategy(ABC):
     """Foundation class for all trading strategies.
 
@@ -27,6 +72,9 @@ class BaseStrategy(ABC):
         Maximum cumulative loss (positive number) before the
         :class:`~engine.guard.StrategyGuard` halts the strategy.
 
+    The base class declares empty ``__slots__``, so a subclass that also
+    lists its state in ``__slots__`` gets instances without a ``__dict__``.
+
     Example::
 
         class MomentumStrategy(BaseStrategy):
@@ -38,9 +86,28 @@ class BaseStrategy(ABC):
                 ...
     """
 
+    __slots__ = ()
+
     topics: ClassVar[list[str]] = []
     max_loss: ClassVar[Decimal] = Decimal("1000")
 
+    handles_trades: ClassVar[bool] = False
+    """Set per subclass: whether it overrides :meth:`on_trade` or
+    :meth:`trade_callback`.  The runner skips trade dispatch when ``False``."""
+
+    handles_funding_rates: ClassVar[bool] = False
+    """Set per subclass: whether it overrides :meth:`on_funding_rate`."""
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.handles_trades = (
+            cls.on_trade is not BaseStrategy.on_trade
+            or cls.trade_callback is not BaseStrategy.trade_callback
+        )
+        cls.handles_funding_rates = (
+            cls.on_funding_rate is not BaseStrategy.on_funding_rate
+        )
+
     def on_start(self) -> None:  # noqa: B027
         """Called once before the strategy begins receiving bars."""
 
@@ -48,10 +115,29 @@ class BaseStrategy(ABC):
     def on_bar(self, bar: AnyBar) -> TargetPosition | None:
         """Called for each new bar, whether live or historical."""
 
+    def on_bars(self, batch: BarBatch) -> list[TargetPosition]:
+        """Called with a chunk of consecutive bars, e.g. when replaying history.
+
+        Override to compute signals over the batch's NumPy columns in one
+        pass.  The default feeds each bar to :meth:`on_bar` and returns the
+        non-``None`` targets in order.
+        """
+        return [target for target in map(self.on_bar, batch) if target is not None]
+
     def on_trade(self, trade: Trade) -> TargetPosition | None:  # noqa: B027
         """Called for each individual trade tick (optional override)."""
         return None
 
+    def trade_callback(self) -> Callable[[Trade], TargetPosition | None]:
+        """Return the callable the engine invokes for every trade tick.
+
+        Resolved once when the strategy is wired up and called directly per
+        trade, so the hottest path skips attribute lookup.  The default is
+        the bound :meth:`on_trade`; override to hand back a faster callable
+        (e.g. a compiled function) with the same signature.
+        """
+        return self.on_trade
+
     def on_funding_rate(self, rate: FundingRate) -> TargetPosition | None:  # noqa: B027
         """Called for each funding-rate update (optional override)."""
         return None
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from data.normalizers.bars import build_dollar_bars, build_tick_bars, build_volume_bars
+from data.types import Trade, TradeBatch
+
+_T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _trades(quantities: list[str], *, price: str = "1") -> list[Trade]:
+    return [
+        Trade(
+            symbol="PEPEUSDT",
+            price=Decimal(price),
+            quantity=Decimal(qty),
+            timestamp=_T0 + timedelta(seconds=i),
+            is_buyer_maker=False,
+        )
+        for i, qty in enumerate(quantities)
+    ]
+
+
+@pytest.mark.regression
+@pytest.mark.parametrize("threshold", [Decimal(1_000), Decimal(10**11)])
+def test_batch_volume_bars_survive_int64_overflow(threshold: Decimal) -> None:
+    # 10 x 5e10 in 1e-8 units is 5e19 — past int64 max
+    trades = _trades(["50000000000"] * 10)
+
+    expected = build_volume_bars(trades, threshold)
+    got = build_volume_bars(TradeBatch.from_trades(trades), threshold)
+
+    assert len(got) == len(expected)
+    assert [b.trade_count for b in got] == [b.trade_count for b in expected]
+    assert [b.volume for b in got] == [b.volume for b in expected]
+
+
+def _mixed_trades() -> list[Trade]:
+    prices = ["100.5", "101.25", "99.75", "100", "102.125", "98.5"]
+    quantities = ["0.3", "1.7", "0.05", "2.5", "0.8", "1.15", "0.6"]
+    return [
+        Trade(
+            symbol="BTCUSDT",
+            price=Decimal(prices[i % len(prices)]),
+            quantity=Decimal(quantities[i % len(quantities)]),
+            timestamp=_T0 + timedelta(milliseconds=250 * i),
+            is_buyer_maker=i % 3 == 0,
+        )
+        for i in range(200)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("build", "threshold"),
+    [
+        (build_volume_bars, Decimal("3.5")),
+        (build_tick_bars, 7),
+        (build_dollar_bars, Decimal(500)),
+    ],
+)
+def test_trade_batch_matches_decimal_path(build: Any, threshold: Any) -> None:
+    trades = _mixed_trades()
+
+    expected = build(trades, threshold)
+    got = build(TradeBatch.from_trades(trades), threshold)
+
+    assert expected
+    assert len(got) == len(expected)
+    for g, e in zip(got, expected, strict=True):
+        # boundaries and prices are exact; the batch volume is a float64 sum
+        assert (g.timestamp, g.close_time, g.trade_count) == (
+            e.timestamp,
+            e.close_time,
+            e.trade_count,
+        )
+        assert (g.open, g.high, g.low, g.close) == (e.open, e.high, e.low, e.close)
+        assert float(g.volume) == pytest.approx(float(e.volume), rel=1e-12)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import ClassVar
+
+import pytest
+
+from execution.types import Order, OrderResult, OrderSide, OrderType, Position
+from interfaces.broker import BaseBroker, BatchingBrokerMixin, BrokerCapability
+
+
+def _order(i: int) -> Order:
+    return Order(
+        symbol="BTC-USDC",
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        quantity=Decimal(1),
+        price=Decimal(i),
+        client_order_id=str(i),
+    )
+
+
+class _BatchBroker(BaseBroker):
+    """Records the size of every native batch it is handed."""
+
+    capabilities: ClassVar[frozenset[BrokerCapability]] = frozenset(
+        {BrokerCapability.BATCH_PLACE}
+    )
+
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+        self.singles = 0
+        self.fail = False
+
+    async def place_order(self, order: Order) -> OrderResult:
+        self.singles += 1
+        return OrderResult(order_id=order.client_order_id, order=order, error=None)
+
+    async def place_orders(self, orders: list[Order]) -> list[OrderResult]:
+        self.batches.append(len(orders))
+        if self.fail:
+            raise ConnectionError("batch rejected")
+        return [
+            OrderResult(order_id=o.client_order_id, order=o, error=None) for o in orders
+        ]
+
+    async def cancel_order(self, order_id: str) -> OrderResult:
+        raise NotImplementedError
+
+    async def cancel_all_orders(self, symbol: str | None = None) -> OrderResult:
+        raise NotImplementedError
+
+    async def open_orders(self, symbol: str | None = None) -> list[Order]:
+        return []
+
+    async def position(self, symbol: str) -> Position | None:
+        return None
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _BatchingBroker(BatchingBrokerMixin, _BatchBroker):
+    pass
+
+
+@pytest.mark.unit
+def test_concurrent_orders_are_coalesced_into_capped_batches() -> None:
+    async def run() -> None:
+        async with _BatchingBroker() as broker:
+            results = await asyncio.gather(
+                *(broker.place_order(_order(i)) for i in range(12))
+            )
+
+        assert isinstance(broker, _BatchingBroker)
+        assert broker.batches == [10, 2]
+        assert broker.singles == 0
+        assert [r.order_id for r in results] == [str(i) for i in range(12)]
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_batch_failure_reaches_every_caller() -> None:
+    async def run() -> None:
+        broker = _BatchingBroker()
+        broker.fail = True
+        async with broker:
+            results = await asyncio.gather(
+                *(broker.place_order(_order(i)) for i in range(3)),
+                return_exceptions=True,
+            )
+        assert broker.batches == [3]
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_orders_outside_the_context_go_straight_through() -> None:
+    async def run() -> None:
+        broker = _BatchingBroker()
+        result = await broker.place_order(_order(7))
+        assert result.order_id == "7"
+        assert broker.singles == 1
+        assert broker.batches == []
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_mixin_requires_native_batch_placement() -> None:
+    with pytest.raises(TypeError, match="BATCH_PLACE"):
+
+        class _NoBatch(BatchingBrokerMixin, _BatchBroker):
+            capabilities: ClassVar[frozenset[BrokerCapability]] = frozenset()
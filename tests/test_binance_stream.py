@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import orjson
+import pytest
+
+from data.connectors.binance import BinanceConnector
+from data.connectors.types import KlineInterval
+
+
+class _FakeConnection:
+    """Stands in for a websockets connection; frames are fed by the test."""
+
+    def __init__(self) -> None:
+        self.inbox: asyncio.Queue[bytes] = asyncio.Queue()
+        self.sent: list[str] = []
+
+    async def recv(self, decode: bool = True) -> bytes:
+        return await self.inbox.get()
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def close(self) -> None:
+        pass
+
+
+def _kline_frame(*, closed: bool, open_time_ms: int) -> bytes:
+    kline = {
+        "t": open_time_ms,
+        "T": open_time_ms + 59_999,
+        "o": "100.0",
+        "h": "101.0",
+        "l": "99.0",
+        "c": "100.5",
+        "v": "12.5",
+        "n": 42,
+        "x": closed,
+        "q": "1256.25",
+        "V": "6.0",
+        "Q": "603.0",
+    }
+    data = {"e": "kline", "E": open_time_ms + 60_000, "s": "BTCUSDT", "k": kline}
+    return orjson.dumps({"stream": "btcusdt@kline_1m", "data": data})
+
+
+def _trade_frame() -> bytes:
+    data = {
+        "e": "trade",
+        "E": 1_700_000_000_001,
+        "t": 7,
+        "p": "100.25",
+        "q": "0.5",
+        "T": 1_700_000_000_000,
+        "m": True,
+    }
+    return orjson.dumps({"stream": "btcusdt@trade", "data": data})
+
+
+@pytest.mark.unit
+def test_only_closed_klines_and_trades_are_emitted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def run() -> None:
+        connector = BinanceConnector()
+        session = connector._streams
+        ws = _FakeConnection()
+
+        async def connect() -> Any:
+            return ws
+
+        monkeypatch.setattr(session, "_connect", connect)
+
+        klines = connector.stream_klines("BTCUSDT", KlineInterval.M1)
+        trades = connector.stream_trades("BTCUSDT")
+        next_kline = asyncio.ensure_future(anext(klines))
+        next_trade = asyncio.ensure_future(anext(trades))
+        # let both generators subscribe before any frame arrives
+        while len(session._queues) < 2:
+            await asyncio.sleep(0)
+
+        for frame in (
+            _kline_frame(closed=False, open_time_ms=1_700_000_000_000),
+            b'{"stream":"btcusdt@trade","data":',  # truncated JSON
+            _kline_frame(closed=True, open_time_ms=1_700_000_060_000),
+            _trade_frame(),
+        ):
+            ws.inbox.put_nowait(frame)
+
+        kline = await asyncio.wait_for(next_kline, 1)
+        trade = await asyncio.wait_for(next_trade, 1)
+        assert kline.open_time_ms == 1_700_000_060_000
+        assert kline.trade_count == 42
+        assert trade.id == 7
+        assert trade.price == "100.25"
+        # the forming bar was filtered out and the malformed frame skipped
+        assert all(q.empty() for qs in session._queues.values() for q in qs)
+        assert session._supervisor is not None
+        assert not session._supervisor.done()
+
+        await klines.aclose()
+        await trades.aclose()
+        await connector.aclose()
+
+    asyncio.run(run())
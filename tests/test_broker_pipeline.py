@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from execution.types import Order, OrderResult, OrderSide, OrderType, Position
+from interfaces.broker import BaseBroker
+
+
+def _order(quantity: str = "1") -> Order:
+    return Order(
+        symbol="BTC-USDC",
+        side=OrderSide.SELL,
+        order_type=OrderType.LIMIT,
+        quantity=Decimal(quantity),
+        price=Decimal(50_000),
+    )
+
+
+class _RecordingBroker(BaseBroker):
+    """Logs every call; cancels wait until ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def place_order(self, order: Order) -> OrderResult:
+        self.calls.append(f"place {order.quantity}")
+        return OrderResult(order_id="o1", order=order, error=None)
+
+    async def cancel_order(self, order_id: str) -> OrderResult:
+        self.calls.append(f"cancel {order_id} start")
+        await self.release.wait()
+        self.calls.append(f"cancel {order_id} end")
+        return OrderResult(order_id=order_id, order=None, error=None)
+
+    async def cancel_all_orders(self, symbol: str | None = None) -> OrderResult:
+        raise NotImplementedError
+
+    async def open_orders(self, symbol: str | None = None) -> list[Order]:
+        self.calls.append("open_orders")
+        return []
+
+    async def position(self, symbol: str) -> Position | None:
+        self.calls.append("position")
+        return Position(
+            symbol=symbol,
+            quantity=Decimal(4),
+            avg_entry_price=Decimal(50_000),
+            unrealized_pnl=Decimal(0),
+            realized_pnl=Decimal(0),
+        )
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.unit
+def test_input_from_builds_the_call_from_the_upstream_result() -> None:
+    async def run() -> None:
+        broker = _RecordingBroker()
+        async with broker.pipeline() as pipe:
+            pos = pipe.position("BTC-USDC")
+            pipe.place_order(
+                input_from=pos, build=lambda p: _order(str(p.quantity / 2))
+            )
+        position, placed = pipe.results
+
+        assert position.quantity == Decimal(4)
+        assert placed.order.quantity == Decimal(2)
+        assert broker.calls == ["position", "place 2"]
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_after_orders_dependents_and_leaves_the_rest_concurrent() -> None:
+    async def run() -> None:
+        broker = _RecordingBroker()
+        broker.release.clear()
+        pipe = broker.pipeline()
+        cancel = pipe.cancel_order("old")
+        pipe.place_order(_order(), after=cancel)
+        pipe.open_orders()
+
+        send = asyncio.ensure_future(pipe.__aexit__(None, None, None))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # the independent read ran while the cancel was still in flight
+        assert broker.calls == ["cancel old start", "open_orders"]
+        broker.release.set()
+        await send
+
+        assert broker.calls[2:] == ["cancel old end", "place 1"]
+        assert len(pipe.results) == 3
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_nothing_is_sent_when_the_block_raises() -> None:
+    async def run() -> None:
+        broker = _RecordingBroker()
+        with pytest.raises(RuntimeError):
+            async with broker.pipeline() as pipe:
+                pipe.place_order(_order())
+                raise RuntimeError
+        assert broker.calls == []
+        assert pipe.results == []
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_dependencies_must_name_earlier_ops() -> None:
+    pipe = _RecordingBroker().pipeline()
+    with pytest.raises(ValueError):
+        pipe.cancel_order("a", after=0)
+    with pytest.raises(ValueError):
+        pipe.place_order(build=lambda _: _order())
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from data.connectors.binance import BinanceConnector
+
+
+@pytest.mark.unit
+def test_pinned_connector_does_not_share_a_movable_client() -> None:
+    async def run() -> None:
+        default = BinanceConnector()
+        other_default = BinanceConnector()
+        pinned = BinanceConnector(select_fastest_rest=False)
+        try:
+            assert default._client is other_default._client
+            assert pinned._client is not default._client
+
+            # a mirror switch on the shared client must not reach the pinned one
+            default._client.base_url = "https://api1.binance.com"
+            assert pinned._client.base_url == BinanceConnector._REST_BASE
+        finally:
+            for connector in (default, other_default, pinned):
+                await connector.aclose()
+
+    asyncio.run(run())
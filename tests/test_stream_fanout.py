@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from clients._common import StreamFanout
+from interfaces.client import OverflowPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+
+def _source(items: list[int], done: asyncio.Event) -> AsyncGenerator[int, None]:
+    async def gen() -> AsyncGenerator[int, None]:
+        for item in items:
+            yield item
+        # hold the feed open so only the overflow policy ends the subscription
+        await done.wait()
+
+    return gen()
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+def test_drop_oldest_keeps_newest_items() -> None:
+    async def run() -> None:
+        fanout = StreamFanout()
+        done = asyncio.Event()
+        sub = fanout.subscribe("k", lambda: _source([1, 2, 3, 4, 5], done), max_lag=2)
+        # the pump starts on the first read and outruns this consumer
+        first = asyncio.ensure_future(anext(sub))
+        await _settle()
+        done.set()
+        items = [await first] + [item async for item in sub]
+
+        assert items == [4, 5]
+        assert fanout.lag_events == 3
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_block_delivers_everything() -> None:
+    async def run() -> None:
+        fanout = StreamFanout()
+        done = asyncio.Event()
+        done.set()
+        sub = fanout.subscribe(
+            "k",
+            lambda: _source([1, 2, 3, 4, 5], done),
+            max_lag=2,
+            on_overflow=OverflowPolicy.BLOCK,
+        )
+        first = await anext(sub)
+        await _settle()
+        rest = [item async for item in sub]
+
+        assert [first, *rest] == [1, 2, 3, 4, 5]
+        assert fanout.lag_events > 0
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_error_ends_the_lagging_subscription() -> None:
+    async def run() -> None:
+        fanout = StreamFanout()
+        done = asyncio.Event()
+        sub = fanout.subscribe(
+            "k",
+            lambda: _source([1, 2, 3, 4, 5], done),
+            max_lag=2,
+            on_overflow=OverflowPolicy.ERROR,
+        )
+        assert await anext(sub) == 1
+        await _settle()
+
+        with pytest.raises(asyncio.QueueFull):
+            while True:
+                await anext(sub)
+        assert fanout.lag_events == 1
+        done.set()
+        await fanout.aclose()
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_subscribers_share_one_source() -> None:
+    async def run() -> None:
+        fanout = StreamFanout()
+        done = asyncio.Event()
+        starts = 0
+
+        def source() -> AsyncGenerator[int, None]:
+            nonlocal starts
+            starts += 1
+            return _source([1, 2, 3], done)
+
+        a = fanout.subscribe("k", source)
+        b = fanout.subscribe("k", source)
+        first_a, first_b = await asyncio.gather(anext(a), anext(b))
+        done.set()
+        rest_a = [item async for item in a]
+        rest_b = [item async for item in b]
+
+        assert starts == 1
+        assert [first_a, *rest_a] == [first_b, *rest_b] == [1, 2, 3]
+        assert fanout.lag_events == 0
+
+    asyncio.run(run())
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from data.connectors.types import KlineInterval
+from interfaces.client import BaseCryptoClient
+
+if TYPE_CHECKING:
+    from data.types import TimeBar
+
+_START = datetime(2024, 1, 1, tzinfo=UTC)
+_END = _START + timedelta(hours=1)
+
+
+class _CountingClient(BaseCryptoClient):
+    """Serves empty bar lists and counts the downloads behind time_bars."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fetches = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def _fetch_time_bars(
+        self,
+        symbol: str,
+        interval: KlineInterval,
+        *,
+        start: datetime,
+        end: datetime,
+    ) -> list[TimeBar]:
+        self.fetches += 1
+        await self.release.wait()
+        return []
+
+    async def volume_bars(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    async def tick_bars(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    async def dollar_bars(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def live_time_bars(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def live_trades(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    @property
+    def lag_events(self) -> int:
+        return 0
+
+    async def feed_health(self, symbol: str) -> Any:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.mark.unit
+def test_closed_window_is_served_from_cache() -> None:
+    async def run() -> None:
+        client = _CountingClient()
+        await client.time_bars("BTCUSDT", KlineInterval.M1, start=_START, end=_END)
+        await client.time_bars("BTCUSDT", KlineInterval.M1, start=_START, end=_END)
+        assert client.fetches == 1
+
+        await client.time_bars("ETHUSDT", KlineInterval.M1, start=_START, end=_END)
+        assert client.fetches == 2
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_concurrent_calls_share_one_fetch() -> None:
+    async def run() -> None:
+        client = _CountingClient()
+        client.release.clear()
+        calls = [
+            asyncio.ensure_future(
+                client.time_bars("BTCUSDT", KlineInterval.M1, start=_START, end=_END)
+            )
+            for _ in range(3)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client.release.set()
+        results = await asyncio.gather(*calls)
+
+        assert client.fetches == 1
+        assert results == [[], [], []]
+        assert not client._bar_fetches
+
+    asyncio.run(run())
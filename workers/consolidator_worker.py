@@ -40,6 +40,7 @@ from engine.order.consolidator import OrderConsolidator
 from execution.brokers.bybit import BybitBroker
 from execution.brokers.paper import PaperBroker
 from execution.types import FillConfirmation, Order, OrderSide, OrderType, PerpOrder
+from interfaces import setup_fast_loop
 
 if TYPE_CHECKING:
     from interfaces.broker import BaseBroker
@@ -298,6 +299,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    setup_fast_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -27,6 +27,7 @@ import clients as _clients_pkg
 from config import NATS_URL
 from data.connectors.types import KlineInterval
 from engine.data import codec
+from interfaces import setup_fast_loop
 from interfaces.client import BaseCryptoClient, BaseCryptoFuturesClient
 from utils.pckgs import discover_subclasses
 
@@ -143,6 +144,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    setup_fast_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -31,6 +31,7 @@ from engine.data.nats_bus import NatsBus
 from engine.strategy.guard import StrategyGuard
 from engine.strategy.pnl_calc import PnLCalc
 from engine.strategy.runner import StrategyRunner
+from interfaces import setup_fast_loop
 from interfaces.strategy import BaseStrategy
 
 if TYPE_CHECKING:
@@ -209,6 +210,7 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    setup_fast_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt: